@@ -15,6 +15,17 @@ Let's make a game! 🚀
 
 import pygame
 import sys
+import os
+
+# Let this game find the shared helpers in game_utils/ (two folders up,
+# once this file is copied to games/your_game/main.py)
+PROJECT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
+
+from game_utils.frame_loop import run_game
+from game_utils.profiling import FrameProfiler
+from game_utils.text import render_text
 
 # ============================================================================
 # CONSTANTS (Your Game Settings)
@@ -74,6 +85,10 @@ class MyGame:
         # Create a clock to control frame rate
         self.clock = pygame.time.Clock()
         
+        # Optional timing tools: run with ARCADE_PROFILE=1, then press
+        # F3 for a speed overlay or F9 to record a cProfile snapshot
+        self.profiler = FrameProfiler("my_game", FPS)
+        
         # TODO: Set up your game variables here!
         # Example:
         # self.player_x = WINDOW_WIDTH // 2
@@ -95,6 +110,7 @@ class MyGame:
         """
         
         for event in pygame.event.get():
+            self.profiler.handle_event(event)
             
             # Did the player close the window?
             if event.type == pygame.QUIT:
@@ -164,37 +180,54 @@ class MyGame:
         # pygame.draw.circle(self.screen, YELLOW, [x, y], radius)
         
         # Example: Draw text (the score?)
-        # font = pygame.font.Font(None, 36)
-        # text = font.render('Score: 0', True, WHITE)
+        # (render_text remembers fonts and text, so drawing it every frame is fast!)
+        # text = render_text(f'Score: {self.score}', 36, WHITE)
         # self.screen.blit(text, [10, 10])
         
         # TODO: Draw game over screen if needed
         if self.game_over:
-            font = pygame.font.Font(None, 72)
-            text = font.render('GAME OVER', True, RED)
+            text = render_text('GAME OVER', 72, RED)
             text_rect = text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2))
             self.screen.blit(text, text_rect)
         
+        # Show the performance overlay (only when profiling is on)
+        self.profiler.draw_overlay(self.screen)
+        
         # Update the display (show everything we drew)
         pygame.display.flip()
     
+    def step(self):
+        """
+        One frame of the game loop.
+        Returns False when the game should stop.
+        """
+        
+        with self.profiler.frame():
+            with self.profiler.phase("events"):
+                self.handle_events()  # 1. Get input
+            with self.profiler.phase("update"):
+                self.update()         # 2. Update game
+            with self.profiler.phase("draw"):
+                self.draw()           # 3. Draw everything
+        return self.running
+    
+    def quit(self):
+        """Clean up when game ends"""
+        
+        pygame.quit()
+        sys.exit()
+    
     def run(self):
         """
         The main game loop!
         
         This keeps the game running continuously.
+        run_game() calls step() FPS times per second (4. Wait to maintain FPS).
+        In a web browser it takes turns with the page so the tab never freezes.
         You don't need to change this!
         """
         
-        while self.running:
-            self.handle_events()  # 1. Get input
-            self.update()         # 2. Update game
-            self.draw()           # 3. Draw everything
-            self.clock.tick(FPS)  # 4. Wait to maintain FPS
-        
-        # Clean up when game ends
-        pygame.quit()
-        sys.exit()
+        run_game(self.step, FPS, self.clock, on_exit=self.quit)
 
 
 # ============================================================================
@@ -32,6 +32,13 @@ import time                     # ⏰ For the carousel timing
 # Import Pygame loader for Pyodide
 from pygame_loader import load_pygame
 
+# Import the game bundle helpers (one download per game for the browser)
+from game_bundles import MOUNT_DIR, bundle_url
+
+# Import the game catalog (remembers which games exist between reruns)
+from game_catalog import GameCatalog
+from game_search import GameSearchIndex, SORT_ORDERS
+
 # ============================================================================
 # SECTION 2: PAGE CONFIGURATION
 # ============================================================================
@@ -73,7 +80,9 @@ st.set_page_config(
 CONFIG = {
     "games_dir": "./games",                    # Where all game folders live
     "default_emoji": "🎮",                     # If a game doesn't have an emoji
-    "items_per_row": 3                         # How many game cards per row
+    "items_per_row": 3,                        # How many game cards per row
+    "rows_per_page": 3,                        # How many rows of cards per page
+    "catalog_snapshot": "./.cache/game_catalog.json"  # Saved copy of the game list
 }
 
 # 💡 LEARNING MOMENT: What's a dictionary?
@@ -153,46 +162,63 @@ def get_all_games():
         ]
     """
     
-    games = []  # Start with an empty list - we'll add games to it!
-    
-    # Get the games directory path
-    games_dir = Path(CONFIG["games_dir"])
+    # 💡 LEARNING MOMENT: Caching!
+    # Streamlit runs this whole file again on every click. Instead of
+    # opening every config.json each time, the catalog remembers what it
+    # read last time. A background "watcher" tells it when a game folder
+    # changes, so this is just reading a list that is already in memory!
+    catalog = get_game_catalog()
+    games = catalog.get_games()
     
-    # Check if the games folder exists
-    if not games_dir.exists():
+    # The catalog remembers if the games folder was missing (no disk check here)
+    if catalog.missing:
         st.error(f"❌ Games directory '{CONFIG['games_dir']}' not found!")
         return []  # Return empty list if no games folder
+    return games
+
+
+@st.cache_resource
+def get_game_catalog():
+    """
+    📖 FUNCTION: get_game_catalog
     
-    # Loop through each item in the games folder
-    # iterdir() gives us everything in a folder
-    for item in games_dir.iterdir():
-        
-        # We only want folders, not random files
-        if item.is_dir():  # is_dir() checks "is this a directory/folder?"
-            
-            # Load the game's configuration
-            config = load_game_config(item)
-            
-            # Create a dictionary with all the game info
-            game_info = {
-                "folder_name": item.name,                                   # Ex: "snake"
-                "path": str(item),                                          # Ex: "./games/snake"
-                "name": config.get("name", item.name) if config else item.name,  # Game name
-                "description": config.get("description", "No description") if config else "No description",
-                "author": config.get("author", "Unknown") if config else "Unknown",
-                "difficulty": config.get("difficulty", "Medium") if config else "Medium",
-                "emoji": config.get("emoji", CONFIG["default_emoji"]) if config else CONFIG["default_emoji"]
-            }
-            
-            # 💡 LEARNING MOMENT: What's .get()?
-            # config.get("name", "Default") means:
-            # "Try to get 'name', but if it doesn't exist, use 'Default' instead"
-            # This prevents errors if a key is missing!
-            
-            # Add this game to our list
-            games.append(game_info)  # append() adds an item to the end of a list
+    WHAT IT DOES: Creates ONE game catalog that every rerun (and every
+    visitor) shares. @st.cache_resource makes Streamlit keep it around.
+    
+    OUTPUT: A GameCatalog that knows about every game folder
+    """
+    
+    catalog = GameCatalog(
+        CONFIG["games_dir"],
+        snapshot_path=CONFIG["catalog_snapshot"],
+        default_emoji=CONFIG["default_emoji"],
+        load_config=load_game_config      # Reuse our config reader from above!
+    )
+    
+    # Watch the games folder for changes (uses the watchdog package).
+    # If watching isn't possible, the catalog checks the disk now and then.
+    catalog.watch()
+    return catalog
+
+
+@st.cache_resource(max_entries=2)
+def get_search_index(catalog_version):
+    """
+    📖 FUNCTION: get_search_index
+    
+    WHAT IT DOES: Builds the search index for the current list of games.
+    
+    INPUT: catalog_version (changes whenever the game list changes)
+    OUTPUT: A GameSearchIndex
     
-    return games  # Give back the complete list of games!
+    DATA STRUCTURE LESSON:
+        An "inverted index" is like the index at the back of a book:
+        it lists every word and the pages (games!) it appears on.
+        Looking a word up is MUCH faster than reading every page.
+        Streamlit only rebuilds it when catalog_version changes.
+    """
+    
+    return GameSearchIndex(get_game_catalog().get_games())
 
 
 def get_difficulty_color(difficulty):
@@ -275,7 +301,9 @@ def create_game_card(game_info):
         
         with col_btn1:
             # Button to run the game
-            if st.button(f"▶️ Play", key=f"play_{game_info['folder_name']}"):
+            # (greyed out for folders without a main.py)
+            if st.button(f"▶️ Play", key=f"play_{game_info['folder_name']}",
+                         disabled=not game_info.get("has_main", True)):
                 st.info(f"🎮 Starting {game_info['name']}...")
                 run_pygame_game(game_info['path'])
         
@@ -307,6 +335,31 @@ def run_pygame_game(game_path):
         st.error(f"❌ Could not find main.py in {game_path}")
         return
     
+    # A bundle (see game_bundles.py) has the code AND the images and sounds
+    # in ONE download. Games import shared helpers (game_utils/) and their
+    # own modules, so main.py on its own can't run. A missing bundle, or
+    # one older than the game's files, is built right here.
+    try:
+        with st.spinner(f"📦 Packing {game_name} for the browser..."):
+            bundle = bundle_url(game_name)
+    except Exception as e:
+        bundle = None
+        print(f"❌ Could not build the bundle for {game_name}: {e}")
+    if not bundle:
+        st.error(f"❌ Could not build a browser bundle for {game_name}. "
+                 f"Try: python game_bundles.py {game_name}")
+        return
+    game_dir = f"{MOUNT_DIR}/games/{game_name}"
+    bundle_runner = "\n".join([
+        "import os, runpy, sys",
+        # The shared game loop uses this (and the launch id the page adds)
+        # to watch the Stop button
+        f"os.environ['ARCADE_GAME_ID'] = {game_name!r}",
+        f"os.chdir({game_dir!r})",
+        f"sys.path.insert(0, {game_dir!r})",
+        "runpy.run_path('main.py', run_name='__main__')",
+    ])
+    
     try:
         st.info(f"🎮 Launching {game_name} in browser...")
         
@@ -342,14 +395,27 @@ def run_pygame_game(game_path):
                             return;
                         }}
                         
-                        loadingText.textContent = "Loading game code...";
+                        const bundleUrl = {json.dumps(bundle)};
                         
-                        // Load the game code
-                        const response = await fetch('{main_script}');
-                        if (!response.ok) {{
-                            throw new Error(`Failed to fetch game file: ${{response.statusText}}`);
+                        // Download the whole game once and unpack it
+                        // into Pyodide's filesystem
+                        window.mountedBundles = window.mountedBundles || {{}};
+                        if (!window.mountedBundles[bundleUrl]) {{
+                            loadingText.textContent = "Downloading game...";
+                            const response = await fetch(bundleUrl);
+                            if (!response.ok) {{
+                                throw new Error(`Failed to fetch game bundle: ${{response.statusText}}`);
+                            }}
+                            const buffer = await response.arrayBuffer();
+                            window.pyodide.unpackArchive(buffer, "zip", {{ extractDir: "{MOUNT_DIR}" }});
+                            window.mountedBundles[bundleUrl] = true;
                         }}
-                        const gameCode = await response.text();
+                        // Every launch gets its own id: a loop left over from an
+                        // earlier launch of this game sees the id change and stops
+                        window.gameLaunchCounter = (window.gameLaunchCounter || 0) + 1;
+                        const launchId = String(window.gameLaunchCounter);
+                        const gameCode = "import os\\nos.environ['ARCADE_LAUNCH_ID'] = "
+                            + JSON.stringify(launchId) + "\\n" + {json.dumps(bundle_runner)};
                         
                         loadingText.textContent = "Initializing game...";
                         
@@ -361,6 +427,7 @@ def run_pygame_game(game_path):
                         // Create a new game instance
                         const gameInstance = {{
                             running: true,
+                            launchId: launchId,
                             stop: function() {{
                                 this.running = false;
                                 if (this.animationFrame) {{
@@ -371,21 +438,8 @@ def run_pygame_game(game_path):
                         
                         window.gameInstances['{game_name}'] = gameInstance;
                         
-                        // Run the game code directly in Pyodide
-                        await window.pyodide.runPythonAsync(`
-                            import pygame
-                            import sys
-                            import js
-                            
-                            # Initialize Pygame
-                            pygame.init()
-                            
-                            # Create a simple display surface
-                            screen = pygame.display.set_mode((800, 600))
-                            pygame.display.set_caption("{game_name}")
-                            
-                            # Run the actual game code
-                        ` + gameCode);
+                        // Run the game code in Pyodide
+                        await window.pyodide.runPythonAsync(gameCode);
                         
                         // Hide loading text when game starts
                         loadingText.style.display = 'none';
@@ -432,6 +486,7 @@ def run_pygame_game(game_path):
         with st.expander("Debug Information"):
             st.write(f"Game path: {game_path}")
             st.write(f"Main script: {main_script}")
+            st.write(f"Bundle: {bundle}")
             st.write("Check browser console (F12) for detailed error messages")
         
     except Exception as e:
@@ -439,6 +494,70 @@ def run_pygame_game(game_path):
         st.write("Please check the browser console for more details.")
 
 
+def get_page_of_games(games, page_number, page_size):
+    """
+    📖 FUNCTION: get_page_of_games
+    
+    WHAT IT DOES: Cuts the big list of games into pages (like a book!)
+    and gives back just the games on one page.
+    
+    INPUT:
+        - games: The full list of games
+        - page_number: Which page we want (starting at 0)
+        - page_size: How many games fit on one page
+    
+    OUTPUT: (games_on_this_page, page_number, total_pages)
+    
+    PERFORMANCE LESSON:
+        Drawing a game card takes time. If we have 500 games, drawing all
+        of them on every click is slow! By only drawing ONE page, the work
+        stays the same no matter how many games we have. 🚀
+    """
+    
+    # Round UP so a half-full last page still counts as a page
+    total_pages = max(1, (len(games) + page_size - 1) // page_size)
+    
+    # Keep the page number in range (games might have been removed!)
+    page_number = max(0, min(page_number, total_pages - 1))
+    
+    # LIST SLICING: games[start:end] gives us just that part of the list
+    start = page_number * page_size
+    return games[start:start + page_size], page_number, total_pages
+
+
+def show_page_controls(page_number, total_pages, key):
+    """
+    📖 FUNCTION: show_page_controls
+    
+    WHAT IT DOES: Shows "Previous" and "Next" buttons to flip pages
+    
+    INPUT:
+        - page_number, total_pages: Where we are in the "book"
+        - key: A unique name so Streamlit can tell button rows apart
+    """
+    
+    if total_pages <= 1:
+        return  # Only one page - no buttons needed!
+    
+    col_prev, col_info, col_next = st.columns([1, 2, 1])
+    
+    with col_prev:
+        if st.button("⬅️ Previous", key=f"{key}_prev", disabled=page_number == 0, use_container_width=True):
+            st.session_state.games_page = page_number - 1
+            st.rerun()
+    
+    with col_info:
+        st.markdown(
+            f"<p style='text-align: center;'>Page {page_number + 1} of {total_pages}</p>",
+            unsafe_allow_html=True
+        )
+    
+    with col_next:
+        if st.button("Next ➡️", key=f"{key}_next", disabled=page_number >= total_pages - 1, use_container_width=True):
+            st.session_state.games_page = page_number + 1
+            st.rerun()
+
+
 def show_game_code(game_path):
     """
     📖 FUNCTION: show_game_code
@@ -827,16 +946,65 @@ if len(games) == 0:
 else:
         # We have games! Let's display them in a grid!
         
+        # ---- SEARCH & FILTERS ----
+        # The index was built ahead of time, so every keystroke is fast!
+        search_index = get_search_index(get_game_catalog().version)
+        
+        search_query = st.text_input(
+            "🔍 Search games",
+            key="game_search",
+            placeholder="Try \"snake\" or \"zombies\"..."
+        )
+        
+        with st.sidebar:
+            st.title("🎨 Game Filters")
+            difficulty_filter = st.selectbox(
+                "Difficulty", ["All"] + list(search_index.difficulty_counts()), key="filter_difficulty"
+            )
+            author_filter = st.selectbox(
+                "Author", ["All"] + search_index.authors(), key="filter_author"
+            )
+            sort_order = st.selectbox(
+                "Sort by", list(SORT_ORDERS), format_func=SORT_ORDERS.get, key="sort_order"
+            )
+        
+        shown_games = search_index.search(
+            search_query,
+            difficulty=None if difficulty_filter == "All" else difficulty_filter,
+            author=None if author_filter == "All" else author_filter,
+            sort=sort_order
+        )
+        
+        # New search? Go back to the first page!
+        current_filters = (search_query, difficulty_filter, author_filter, sort_order)
+        if st.session_state.get("last_filters") != current_filters:
+            st.session_state.last_filters = current_filters
+            st.session_state.games_page = 0
+        
+        if not shown_games:
+            st.info("🤔 No games match your search. Try different words or filters!")
+        
         # LAYOUT MAGIC: Create a grid with multiple columns
         # We'll put 3 games per row (you can change this!)
         
         items_per_row = CONFIG["items_per_row"]
         
+        # Only build the cards for ONE page of games
+        # (the page size is rows × items per row)
+        page_size = items_per_row * CONFIG["rows_per_page"]
+        if 'games_page' not in st.session_state:
+            st.session_state.games_page = 0
+        
+        page_games, page_number, total_pages = get_page_of_games(
+            shown_games, st.session_state.games_page, page_size
+        )
+        st.session_state.games_page = page_number
+        
         # 💡 LEARNING MOMENT: We're going to use a loop to create rows!
         # range(start, stop, step) creates numbers
         # Example: range(0, 9, 3) gives us 0, 3, 6
         
-        for i in range(0, len(games), items_per_row):
+        for i in range(0, len(page_games), items_per_row):
             # Create columns for this row
             cols = st.columns(items_per_row)
             
@@ -844,10 +1012,12 @@ else:
             for col_idx in range(items_per_row):
                 game_idx = i + col_idx
                 
-                # Make sure we don't go past the end of our games list!
-                if game_idx < len(games):
+                # Make sure we don't go past the end of this page!
+                if game_idx < len(page_games):
                     with cols[col_idx]:
-                        create_game_card(games[game_idx])
+                        create_game_card(page_games[game_idx])
+        
+        show_page_controls(page_number, total_pages, key="games_pages")
 
         # ========================================
         # FOOTER SECTION
@@ -869,25 +1039,15 @@ else:
         # ========================================
         
         with st.sidebar:
-            st.title("🎨 Game Filters")
-            st.info("Coming soon: Filter games by difficulty, author, and more!")
-            
             st.markdown("---")
             
             st.title("📊 Statistics")
             
             if len(games) > 0:
                 # Count games by difficulty
-                # This uses a DATA STRUCTURE technique called "counting"!
-                
-                difficulty_counts = {}  # Empty dictionary to store counts
-                
-                for game in games:
-                    diff = game['difficulty']
-                    if diff in difficulty_counts:
-                        difficulty_counts[diff] += 1  # Add 1 to existing count
-                    else:
-                        difficulty_counts[diff] = 1    # Start counting this difficulty
+                # The search index already grouped ("bucketed") the games
+                # by difficulty, so counting is just asking each group's size!
+                difficulty_counts = search_index.difficulty_counts()
                 
                 # Display the counts
                 st.write("**Games by Difficulty:**")
@@ -0,0 +1,272 @@
+"""
+Run large batches of headless game episodes across all CPU cores.
+
+A game takes part if its config.json names a "headless" module (a file in
+the game folder) that provides:
+
+    run_episode(seed, policy, max_frames=...) -> {"score", "lines_cleared",
+                                              "length", "frames", "finished"}
+    POLICIES                                 {name: policy function}
+
+Seeds are split into shards that worker processes play in parallel. Each
+shard's episodes (one row per episode, one column per field) are streamed
+to the results file as soon as the shard is done, and summary statistics
+for every numeric column are printed and saved at the end.
+
+    python batch_runner.py snake --seeds 0:10000 --policy greedy
+    python batch_runner.py tetris --seeds 0:100000 --policy drop --workers 8
+    python batch_runner.py tetris --output tetris.csv
+
+Results are written as Parquet - a columnar file, one row group per shard
+- when pyarrow is installed. Without pyarrow (or for a file name ending in
+.csv) they are written as CSV, a plain row-by-row text file. The summary
+goes to <output>.summary.json.
+"""
+import argparse
+import csv
+import importlib.util
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent
+GAMES_DIR = ROOT_DIR / "games"
+
+COLUMNS = ("game", "policy", "seed", "score", "lines_cleared", "length", "frames", "finished")
+NUMERIC_COLUMNS = ("score", "lines_cleared", "length", "frames")
+SUMMARY_PERCENTILES = (5, 50, 95)
+
+# Parquet output needs pyarrow (optional - CSV works without it)
+HAVE_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+# Headless modules already imported in this process (one per game)
+_modules = {}
+
+
+def load_headless(game_id):
+    """Import the game's headless module named in its config.json."""
+    module = _modules.get(game_id)
+    if module is not None:
+        return module
+
+    folder = GAMES_DIR / game_id
+    config_path = folder / "config.json"
+    if not config_path.exists():
+        raise LookupError(f"No game called {game_id!r} (expected {config_path})")
+    with open(config_path, "r") as file:
+        config = json.load(file)
+    module_name = config.get("headless")
+    if not module_name:
+        raise LookupError(f"{game_id} has no headless core - add \"headless\" to its config.json")
+
+    # The core may import its neighbours (tetris_core imports tetris_board)
+    if str(folder) not in sys.path:
+        sys.path.insert(0, str(folder))
+    spec = importlib.util.spec_from_file_location(module_name, folder / f"{module_name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    _modules[game_id] = module
+    return module
+
+
+def run_shard(game_id, policy, seeds, max_frames):
+    """Play every seed in a shard (runs in a worker process)."""
+    module = load_headless(game_id)
+    # No limit given? Use the game's own default
+    limit = {} if max_frames is None else {"max_frames": max_frames}
+    rows = []
+    for seed in seeds:
+        result = module.run_episode(seed, policy, **limit)
+        rows.append({"game": game_id, "policy": policy, "seed": seed, **result})
+    return rows
+
+
+def shard_seeds(seeds, shard_size):
+    return [seeds[i:i + shard_size] for i in range(0, len(seeds), shard_size)]
+
+
+def parse_seeds(text):
+    """'0:1000' -> range(0, 1000); '7' -> range(7, 8)"""
+    if ":" in text:
+        start, stop = text.split(":", 1)
+        return range(int(start), int(stop))
+    return range(int(text), int(text) + 1)
+
+
+# ----------------------------------------------------------------------
+# Output
+# ----------------------------------------------------------------------
+
+class CsvWriter:
+    def __init__(self, path):
+        self.file = open(path, "w", newline="")
+        self.writer = csv.DictWriter(self.file, fieldnames=COLUMNS)
+        self.writer.writeheader()
+
+    def write(self, rows):
+        self.writer.writerows(rows)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+class ParquetWriter:
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("❌ Writing .parquet needs pyarrow (pip install pyarrow) - or use a .csv file")
+        self.pa = pa
+        self.schema = pa.schema([
+            ("game", pa.string()), ("policy", pa.string()), ("seed", pa.int64()),
+            ("score", pa.int64()), ("lines_cleared", pa.int64()), ("length", pa.int64()),
+            ("frames", pa.int64()), ("finished", pa.bool_()),
+        ])
+        self.writer = pq.ParquetWriter(path, self.schema)
+
+    def write(self, rows):
+        columns = {name: [row[name] for row in rows] for name in COLUMNS}
+        self.writer.write_table(self.pa.table(columns, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+
+
+def open_writer(path):
+    return ParquetWriter(path) if str(path).endswith(".parquet") else CsvWriter(path)
+
+
+def output_path(output, game_id, policy):
+    """
+    Where results go: Parquet by default. Without pyarrow, a .parquet
+    file becomes a .csv file next to it (with a warning).
+    """
+    output = str(output or f"batch-{game_id}-{policy}.parquet")
+    if output.endswith(".parquet") and not HAVE_PYARROW:
+        csv_output = output[:-len(".parquet")] + ".csv"
+        print(f"⚠️  pyarrow isn't installed (pip install pyarrow) - "
+              f"writing CSV to {csv_output} instead of Parquet")
+        output = csv_output
+    return output
+
+
+# ----------------------------------------------------------------------
+# Summary statistics (collected while results stream in)
+# ----------------------------------------------------------------------
+
+class Summary:
+    def __init__(self):
+        self.values = {name: [] for name in NUMERIC_COLUMNS}
+        self.episodes = 0
+        self.finished = 0
+
+    def add(self, rows):
+        for row in rows:
+            self.episodes += 1
+            self.finished += bool(row["finished"])
+            for name in NUMERIC_COLUMNS:
+                if row[name] is not None:
+                    self.values[name].append(row[name])
+
+    def result(self):
+        summary = {"episodes": self.episodes, "finished": self.finished, "columns": {}}
+        for name, values in self.values.items():
+            if not values:
+                continue
+            values.sort()
+            count = len(values)
+            mean = sum(values) / count
+            stats = {
+                "count": count,
+                "mean": round(mean, 4),
+                "std": round(math.sqrt(sum((v - mean) ** 2 for v in values) / count), 4),
+                "min": values[0],
+                "max": values[-1],
+            }
+            for pct in SUMMARY_PERCENTILES:
+                stats[f"p{pct}"] = values[min(count - 1, max(0, round(pct / 100 * count) - 1))]
+            summary["columns"][name] = stats
+        return summary
+
+
+def print_summary(summary):
+    print(f"\n{summary['episodes']} episodes ({summary['finished']} played to the end)")
+    print(f"{'column':<14} {'mean':>10} {'std':>10} {'min':>8} {'p50':>8} {'p95':>8} {'max':>8}")
+    for name, s in summary["columns"].items():
+        print(f"{name:<14} {s['mean']:>10.2f} {s['std']:>10.2f} {s['min']:>8} "
+              f"{s['p50']:>8} {s['p95']:>8} {s['max']:>8}")
+
+
+# ----------------------------------------------------------------------
+# Running a batch
+# ----------------------------------------------------------------------
+
+def run_batch(game_id, seeds, policy="random", output=None, workers=None,
+              shard_size=None, max_frames=None):
+    module = load_headless(game_id)  # Fail early on a bad game id or policy
+    if policy not in module.POLICIES:
+        raise SystemExit(f"❌ Unknown policy {policy!r} for {game_id} (pick one of: {', '.join(module.POLICIES)})")
+
+    seeds = list(seeds)
+    workers = workers or os.cpu_count() or 1
+    # Several shards per worker keeps every core busy until the end
+    shard_size = shard_size or max(1, min(1000, len(seeds) // (workers * 4) or 1))
+    output = output_path(output, game_id, policy)
+
+    print(f"🎲 {game_id}: {len(seeds)} episodes, policy {policy!r}, "
+          f"{workers} workers, shards of {shard_size}")
+    summary = Summary()
+    writer = open_writer(output)
+    started = time.perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            jobs = [pool.submit(run_shard, game_id, policy, shard, max_frames)
+                    for shard in shard_seeds(seeds, shard_size)]
+            for job in as_completed(jobs):
+                rows = job.result()
+                writer.write(rows)
+                summary.add(rows)
+    finally:
+        writer.close()
+    elapsed = time.perf_counter() - started
+
+    result = summary.result()
+    result.update({"game": game_id, "policy": policy, "seconds": round(elapsed, 3),
+                   "episodes_per_second": round(summary.episodes / elapsed, 1) if elapsed else None})
+    print_summary(result)
+    print(f"⏱️  {elapsed:.2f}s ({result['episodes_per_second']} episodes/s)")
+    print(f"📄 Episodes written to {output}")
+
+    summary_path = f"{output}.summary.json"
+    with open(summary_path, "w") as file:
+        json.dump(result, file, indent=2)
+    print(f"📄 Summary written to {summary_path}")
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Play many headless game episodes in parallel.")
+    parser.add_argument("game", help="game folder name (its config.json needs \"headless\")")
+    parser.add_argument("--seeds", type=parse_seeds, default=range(0, 1000),
+                        help="seed range as START:STOP (default: 0:1000)")
+    parser.add_argument("--policy", default="random", help="which policy plays (default: random)")
+    parser.add_argument("--output", help="results file, .parquet or .csv "
+                        "(default: batch-<game>-<policy>.parquet, or .csv without pyarrow)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--shard-size", type=int, help="episodes per shard (default: automatic)")
+    parser.add_argument("--max-frames", type=int, help="stop an episode after this many frames")
+    args = parser.parse_args(argv)
+    run_batch(args.game, args.seeds, args.policy, args.output, args.workers,
+              args.shard_size, args.max_frames)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
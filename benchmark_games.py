@@ -0,0 +1,239 @@
+"""
+Headless frame-time benchmark for every game in the games/ folder.
+
+Each game is found through its config.json ("main_class" names the game
+class), started with SDL's dummy video/audio drivers, and driven with
+scripted (seeded random) key presses for a number of frames. Every frame
+is split into four timed phases:
+
+    input   handle_input() / handle_events()
+    update  update()
+    draw    draw() without the final display flip/update
+    flip    pygame.display.flip() / pygame.display.update()
+
+Results (p50/p95/p99/mean per phase, in milliseconds) are printed and
+written to a JSON file so slowdowns show up in review.
+
+    python benchmark_games.py                       # all games, 600 frames
+    python benchmark_games.py snake --frames 2000
+    python benchmark_games.py --output bench.json
+"""
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import sys
+import time
+from pathlib import Path
+
+# Must be set before pygame is imported anywhere
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+ROOT_DIR = Path(__file__).resolve().parent
+GAMES_DIR = ROOT_DIR / "games"
+
+PHASES = ("input", "update", "draw", "flip")
+PERCENTILES = (50, 95, 99)
+
+# Keys the scripted player presses (every game ignores the ones it doesn't use)
+SCRIPT_KEYS = (pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE)
+
+
+def discover_games(names=None):
+    """[(folder, config)] for every game folder with a config.json and main.py."""
+    games = []
+    for config_path in sorted(GAMES_DIR.glob("*/config.json")):
+        folder = config_path.parent
+        if names and folder.name not in names:
+            continue
+        if not (folder / "main.py").exists():
+            continue
+        with open(config_path, "r") as file:
+            games.append((folder, json.load(file)))
+    return games
+
+
+def load_game_class(folder, config):
+    """Import a game's main.py and return its main class."""
+    if str(folder) not in sys.path:
+        sys.path.insert(0, str(folder))
+    spec = importlib.util.spec_from_file_location(f"bench_{folder.name}", folder / "main.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    class_name = config.get("main_class")
+    if class_name:
+        return getattr(module, class_name)
+    # No main_class in config.json? Guess: the *Game class defined in main.py
+    for name, value in vars(module).items():
+        if isinstance(value, type) and value.__module__ == module.__name__ and name.endswith("Game"):
+            return value
+    raise LookupError(f"No game class found in {folder / 'main.py'} - add \"main_class\" to config.json")
+
+
+class ScriptedInput:
+    """Posts seeded random key presses (and matching releases) into the event queue."""
+
+    def __init__(self, seed, press_chance=0.15, hold_frames=(1, 8)):
+        self.rng = random.Random(seed)
+        self.press_chance = press_chance
+        self.hold_frames = hold_frames
+        self.held = {}  # key -> frames left until release
+
+    def next_frame(self):
+        for key in list(self.held):
+            self.held[key] -= 1
+            if self.held[key] <= 0:
+                del self.held[key]
+                pygame.event.post(pygame.event.Event(pygame.KEYUP, key=key, mod=0))
+        if self.rng.random() < self.press_chance:
+            key = self.rng.choice(SCRIPT_KEYS)
+            if key not in self.held:
+                self.held[key] = self.rng.randint(*self.hold_frames)
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=key, mod=0))
+
+
+class DeferredDisplay:
+    """
+    Swaps out pygame.display.flip/update while draw() runs, so the harness
+    can time presenting the frame as its own phase.
+    """
+
+    def __init__(self):
+        self.flip = pygame.display.flip
+        self.update = pygame.display.update
+        self.pending = None
+
+    def __enter__(self):
+        pygame.display.flip = lambda: self._defer(self.flip, ())
+        pygame.display.update = lambda *args: self._defer(self.update, args)
+        return self
+
+    def __exit__(self, *exc):
+        pygame.display.flip = self.flip
+        pygame.display.update = self.update
+
+    def _defer(self, func, args):
+        self.pending = (func, args)
+
+    def present(self):
+        if self.pending:
+            func, args = self.pending
+            self.pending = None
+            func(*args)
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(samples):
+    values = sorted(samples)
+    summary = {f"p{pct}_ms": round(percentile(values, pct) * 1000, 4) for pct in PERCENTILES}
+    summary["mean_ms"] = round(sum(values) / len(values) * 1000, 4) if values else 0.0
+    summary["max_ms"] = round(values[-1] * 1000, 4) if values else 0.0
+    return summary
+
+
+def benchmark_game(game_class, frames, seed):
+    """Drive one game for `frames` frames; returns per-phase samples (seconds)."""
+    random.seed(seed)
+    script = ScriptedInput(seed)
+    game = game_class()
+    handle_input = getattr(game, "handle_input", None) or game.handle_events
+    samples = {phase: [] for phase in PHASES + ("frame",)}
+    restarts = 0
+
+    with DeferredDisplay() as display:
+        for _ in range(frames):
+            script.next_frame()
+
+            t0 = time.perf_counter()
+            handle_input()
+            t1 = time.perf_counter()
+            game.update()
+            t2 = time.perf_counter()
+            game.draw()
+            t3 = time.perf_counter()
+            display.present()
+            t4 = time.perf_counter()
+
+            samples["input"].append(t1 - t0)
+            samples["update"].append(t2 - t1)
+            samples["draw"].append(t3 - t2)
+            samples["flip"].append(t4 - t3)
+            samples["frame"].append(t4 - t0)
+
+            # Games that stop themselves (running = False) get a fresh start
+            if getattr(game, "running", True) is False:
+                restarts += 1
+                game = game_class()
+                handle_input = getattr(game, "handle_input", None) or game.handle_events
+
+    return samples, restarts
+
+
+def run(names=None, frames=600, seed=1234, output="bench_results.json"):
+    pygame.init()
+    results = {
+        "meta": {
+            "frames": frames,
+            "seed": seed,
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "sdl": ".".join(map(str, pygame.get_sdl_version())),
+            "platform": platform.platform(),
+            "video_driver": os.environ.get("SDL_VIDEODRIVER"),
+        },
+        "games": {},
+    }
+
+    for folder, config in discover_games(names):
+        game_class = load_game_class(folder, config)
+        print(f"⏱️  {config.get('name', folder.name)} ({game_class.__name__}), {frames} frames...")
+        samples, restarts = benchmark_game(game_class, frames, seed)
+        results["games"][folder.name] = {
+            "name": config.get("name", folder.name),
+            "class": game_class.__name__,
+            "restarts": restarts,
+            "phases": {phase: summarize(values) for phase, values in samples.items()},
+        }
+
+    print_table(results)
+    if output:
+        with open(output, "w") as file:
+            json.dump(results, file, indent=2)
+        print(f"📄 Results written to {output}")
+    return results
+
+
+def print_table(results):
+    print(f"\n{'game':<10} {'phase':<8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'mean ms':>9}")
+    for folder, game in results["games"].items():
+        for phase, stats in game["phases"].items():
+            print(f"{folder:<10} {phase:<8} {stats['p50_ms']:>9.3f} {stats['p95_ms']:>9.3f} "
+                  f"{stats['p99_ms']:>9.3f} {stats['mean_ms']:>9.3f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Headless frame-time benchmark for the games.")
+    parser.add_argument("games", nargs="*", help="game folder names (default: all)")
+    parser.add_argument("--frames", type=int, default=600, help="frames per game (default: 600)")
+    parser.add_argument("--seed", type=int, default=1234, help="seed for scripted input and game RNG")
+    parser.add_argument("--output", default="bench_results.json", help="JSON results file")
+    args = parser.parse_args(argv)
+    run(set(args.games) or None, args.frames, args.seed, args.output)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,191 @@
+"""
+Game bundles for the browser runtime.
+
+Instead of fetching main.py (and never the images or sounds), the browser
+downloads ONE compressed zip per game and unpacks it into Pyodide's
+virtual filesystem. Each bundle holds:
+
+- every file in the game folder (code, config, img/, songs/, ...)
+- compiled bytecode (__pycache__/*.pyc) for every .py file
+- the shared helper code listed in SHARED_PATHS
+
+Bundles are named after a hash of their contents (snake-1a2b3c4d5e6f.zip),
+so browsers can cache them forever.
+
+    python game_bundles.py            # build bundles for every game
+    python game_bundles.py snake      # just one game
+
+The manifest also remembers a fingerprint of each game's source files
+(names, sizes and modification times). bundle_url() rebuilds a bundle
+that is missing or older than its sources, so the website never serves
+stale code - building by hand just saves the wait on the first Play.
+"""
+import argparse
+import hashlib
+import io
+import json
+import os
+import py_compile
+import sys
+import tempfile
+import threading
+import zipfile
+from pathlib import Path
+
+from pyodide_bundle import STATIC_DIR, static_url
+
+ROOT_DIR = Path(__file__).resolve().parent
+GAMES_DIR = ROOT_DIR / "games"
+BUNDLES_DIR = STATIC_DIR / "bundles"
+MANIFEST_PATH = BUNDLES_DIR / "manifest.json"
+
+# Where bundles are unpacked inside Pyodide. The zip mirrors the project
+# layout, so a game lives at /arcade/games/<folder>/.
+MOUNT_DIR = "/arcade"
+
+# Project files (relative to ROOT_DIR) that every game bundle includes
+SHARED_PATHS = ("game_utils",)
+
+SKIP_DIRS = {"__pycache__", ".git", ".pytest_cache"}
+SKIP_SUFFIXES = {".pyc", ".pyo"}
+
+# A fixed timestamp keeps the zip bytes (and so the hash) reproducible
+ZIP_DATE = (2020, 1, 1, 0, 0, 0)
+
+# Several visitors may press Play at once - only one rebuild at a time
+_build_lock = threading.Lock()
+
+
+def _bundle_files(game_dir):
+    """(path on disk, path inside the zip) for everything in the bundle."""
+    sources = [game_dir] + [ROOT_DIR / shared for shared in SHARED_PATHS]
+    for source in sources:
+        if source.is_file():
+            yield source, source.relative_to(ROOT_DIR).as_posix()
+            continue
+        for folder, dirs, files in os.walk(source):
+            dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+            for name in sorted(files):
+                path = Path(folder) / name
+                if path.suffix not in SKIP_SUFFIXES:
+                    yield path, path.relative_to(ROOT_DIR).as_posix()
+
+
+def sources_fingerprint(game_dir):
+    """
+    A short hash of the (name, size, modification time) of every file that
+    goes into the game's bundle. Cheap: it only looks at file stats.
+    """
+    digest = hashlib.sha256()
+    for path, arcname in _bundle_files(Path(game_dir).resolve()):
+        stat = path.stat()
+        digest.update(f"{arcname}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()[:12]
+
+
+def _compiled(path):
+    """Bytecode for a .py file, as the matching __pycache__ entry."""
+    cache_name = f"__pycache__/{path.stem}.{sys.implementation.cache_tag}.pyc"
+    with tempfile.TemporaryDirectory() as tmp:
+        cfile = Path(tmp) / "out.pyc"
+        # Hash-based pycs stay valid after unpacking (file mtimes change)
+        py_compile.compile(str(path), cfile=str(cfile), doraise=True,
+                           invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH)
+        return cache_name, cfile.read_bytes()
+
+
+def build_bundle(game_dir, out_dir=BUNDLES_DIR):
+    """Pack one game folder into a content-hashed zip. Returns its filename."""
+    game_dir = Path(game_dir).resolve()
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=9) as bundle:
+        for path, arcname in _bundle_files(game_dir):
+            entries = [(arcname, path.read_bytes())]
+            if path.suffix == ".py":
+                try:
+                    cache_name, code = _compiled(path)
+                    entries.append((f"{Path(arcname).parent.as_posix()}/{cache_name}", code))
+                except py_compile.PyCompileError as e:
+                    print(f"⚠️ Not compiling {arcname}: {e.msg}")
+            for name, data in entries:
+                info = zipfile.ZipInfo(name, date_time=ZIP_DATE)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.external_attr = 0o644 << 16
+                bundle.writestr(info, data)
+
+    data = buffer.getvalue()
+    filename = f"{game_dir.name}-{hashlib.sha256(data).hexdigest()[:12]}.zip"
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / filename).write_bytes(data)
+    return filename
+
+
+def build_all(names=None):
+    """Build bundles for the given game folders (default: all of them)."""
+    manifest = read_manifest() or {}
+    games = sorted(p for p in GAMES_DIR.iterdir() if (p / "main.py").exists())
+    for game_dir in games:
+        if names and game_dir.name not in names:
+            continue
+        filename = build_bundle(game_dir)
+        old = manifest.get(game_dir.name)
+        if old and old["file"] != filename:
+            (BUNDLES_DIR / old["file"]).unlink(missing_ok=True)
+        manifest[game_dir.name] = {
+            "file": filename,
+            "size": (BUNDLES_DIR / filename).stat().st_size,
+            "python": sys.implementation.cache_tag,
+            "sources": sources_fingerprint(game_dir),
+        }
+        print(f"📦 {game_dir.name}: {filename} ({manifest[game_dir.name]['size'] // 1024} KB)")
+
+    with open(MANIFEST_PATH, "w") as file:
+        json.dump(manifest, file, indent=2, sort_keys=True)
+    return manifest
+
+
+def read_manifest():
+    try:
+        with open(MANIFEST_PATH, "r") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def _is_current(entry, game_dir):
+    return (entry is not None
+            and (BUNDLES_DIR / entry["file"]).exists()
+            and entry.get("sources") == sources_fingerprint(game_dir))
+
+
+def bundle_url(folder_name, rebuild=True):
+    """
+    Browser URL of a game's bundle. A missing bundle, or one older than
+    the game's files, is (re)built first unless rebuild is False.
+    None if there is no such game (or no bundle and rebuild is False).
+    """
+    game_dir = GAMES_DIR / folder_name
+    if not (game_dir / "main.py").exists():
+        return None
+    entry = (read_manifest() or {}).get(folder_name)
+    if not _is_current(entry, game_dir):
+        if not rebuild:
+            return None
+        with _build_lock:
+            entry = (read_manifest() or {}).get(folder_name)
+            if not _is_current(entry, game_dir):  # Someone else may have just built it
+                entry = build_all({folder_name})[folder_name]
+    return static_url() + "bundles/" + entry["file"]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build browser bundles for the games.")
+    parser.add_argument("games", nargs="*", help="game folder names (default: all)")
+    args = parser.parse_args(argv)
+    build_all(set(args.games) or None)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
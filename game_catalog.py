@@ -0,0 +1,311 @@
+"""
+Game catalog index for the arcade website.
+This module remembers what is in the games folder so the website doesn't
+have to re-read every config.json on every Streamlit rerun.
+
+Each game folder is stored with a "fingerprint": its config.json's
+modification time + file size, and whether it has a main.py (games
+without one can't be played). A folder is only re-read when its
+fingerprint changes. The index also lives on disk as a JSON snapshot, so
+a freshly started server can skip parsing unchanged configs too.
+
+With watch() turned on, a background watchdog observer applies file
+changes as they happen and get_games() never touches the disk at all.
+"""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+# Watchdog is optional - without it we fall back to checking the disk
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+
+# Bump this if the layout of the snapshot file ever changes
+SNAPSHOT_VERSION = 2
+
+# Files inside a game folder whose changes affect the catalog
+WATCHED_FILES = ("config.json", "main.py")
+
+
+def build_game_info(folder, config, default_emoji="🎮", has_main=True):
+    """
+    Turn a game folder and its (possibly missing) config into the
+    dictionary the website uses to draw a game card.
+    """
+    config = config or {}
+    return {
+        "folder_name": folder.name,
+        "path": str(folder),
+        "name": config.get("name", folder.name),
+        "description": config.get("description", "No description"),
+        "author": config.get("author", "Unknown"),
+        "difficulty": config.get("difficulty", "Medium"),
+        "emoji": config.get("emoji", default_emoji),
+        "has_main": has_main,
+    }
+
+
+def _read_config_file(folder):
+    """Fallback config reader used when no loader is passed in."""
+    config_path = Path(folder) / "config.json"
+    if not config_path.exists():
+        return None
+    try:
+        with open(config_path, "r") as file:
+            return json.load(file)
+    except Exception as e:
+        print(f"❌ Error loading config for {folder}: {e}")
+        return None
+
+
+def config_fingerprint(folder):
+    """
+    Return (mtime_ns, size) of a folder's config.json, or None if the
+    folder has no config. Two equal fingerprints mean "nothing changed".
+    """
+    try:
+        stat = os.stat(Path(folder) / "config.json")
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def folder_fingerprint(folder):
+    """[config.json's fingerprint (or None), does main.py exist?]"""
+    return [config_fingerprint(folder), (Path(folder) / "main.py").is_file()]
+
+
+class GameCatalog:
+    """
+    An index of every game folder, keyed by folder path.
+
+    get_games() returns the same list object until something changes, so
+    callers should treat it as read-only.
+    """
+
+    def __init__(self, games_dir, snapshot_path=None, default_emoji="🎮",
+                 load_config=None, check_interval=2.0):
+        self.games_dir = Path(games_dir)
+        self._games_dir_abs = Path(os.path.abspath(games_dir))
+        self.snapshot_path = Path(snapshot_path) if snapshot_path else None
+        self.default_emoji = default_emoji
+        self.load_config = load_config or _read_config_file
+        # How long (seconds) a validated catalog is trusted before we
+        # look at the disk again. Inside this window get_games() is O(1).
+        self.check_interval = check_interval
+
+        # folder path -> {"fingerprint": [...], "game": {...}}
+        self._entries = {}
+        self._games = []
+        # Goes up by one every time the games list changes, so other code
+        # can cache things built from it (like the search index)
+        self.version = 0
+        self._last_check = None
+        # True if the last look at the disk found no games folder at all
+        self.missing = False
+        self._lock = threading.Lock()
+        self._observer = None
+
+        self._load_snapshot()
+
+    # ------------------------------------------------------------------
+    # Reading the catalog
+    # ------------------------------------------------------------------
+
+    def get_games(self):
+        """Return the list of game info dictionaries (sorted by folder)."""
+        if self._observer is not None:
+            # The watcher keeps self._games current - just hand it out
+            return self._games
+
+        now = time.monotonic()
+        if self._last_check is not None and now - self._last_check < self.check_interval:
+            return self._games
+
+        with self._lock:
+            if self._last_check is None or now - self._last_check >= self.check_interval:
+                self._refresh()
+                self._last_check = time.monotonic()
+            return self._games
+
+    def invalidate(self):
+        """Force the next get_games() call to look at the disk again."""
+        self._last_check = None
+
+    # ------------------------------------------------------------------
+    # Watching the games folder
+    # ------------------------------------------------------------------
+
+    @property
+    def watching(self):
+        return self._observer is not None
+
+    def watch(self):
+        """
+        Start a background watcher that applies add/modify/delete events
+        for game folders as they happen. Returns True if watching started.
+        """
+        if self._observer is not None:
+            return True
+        if Observer is None:
+            return False
+
+        with self._lock:
+            # One full scan so the index is correct before events arrive
+            self._refresh()
+            try:
+                observer = Observer()
+                observer.schedule(_CatalogEventHandler(self), str(self.games_dir), recursive=True)
+                observer.daemon = True
+                observer.start()
+            except Exception as e:
+                print(f"⚠️ Could not watch {self.games_dir}, falling back to polling: {e}")
+                return False
+            self._observer = observer
+        return True
+
+    def stop_watching(self):
+        if self._observer is None:
+            return
+        self._observer.stop()
+        self._observer.join(timeout=2)
+        self._observer = None
+        self.invalidate()
+
+    def apply_change(self, path):
+        """
+        Update the index for one changed path (a game folder, or a watched
+        file inside one). Paths outside game folders are ignored.
+        """
+        folder = self._folder_for(path)
+        if folder is None:
+            return
+
+        with self._lock:
+            key = str(folder)
+            if not folder.is_dir():
+                if key not in self._entries:
+                    return
+                entries = dict(self._entries)
+                del entries[key]
+            else:
+                fingerprint = folder_fingerprint(folder)
+                entry = self._entries.get(key)
+                if entry is not None and entry["fingerprint"] == fingerprint:
+                    return
+                entries = dict(self._entries)
+                entries[key] = self._build_entry(folder, fingerprint)
+                entries = dict(sorted(entries.items()))
+
+            # Swap in new objects so readers never see a half-updated list
+            self._set_entries(entries)
+            self._save_snapshot()
+
+    def _folder_for(self, path):
+        """Map a changed path to its game folder, or None if irrelevant."""
+        try:
+            parts = Path(os.path.abspath(path)).relative_to(self._games_dir_abs).parts
+        except ValueError:
+            return None
+        if len(parts) == 1 or (len(parts) == 2 and parts[1] in WATCHED_FILES):
+            return self.games_dir / parts[0]
+        return None
+
+    # ------------------------------------------------------------------
+    # Keeping the index up to date
+    # ------------------------------------------------------------------
+
+    def _refresh(self):
+        """Stat every game folder and only re-read the ones that changed."""
+        try:
+            folders = sorted(item for item in self.games_dir.iterdir() if item.is_dir())
+            self.missing = False
+        except OSError:
+            folders = []
+            self.missing = not self.games_dir.exists()
+
+        entries = {}
+        changed = False
+        for folder in folders:
+            key = str(folder)
+            fingerprint = folder_fingerprint(folder)
+            entry = self._entries.get(key)
+            if entry is None or entry["fingerprint"] != fingerprint:
+                entry = self._build_entry(folder, fingerprint)
+                changed = True
+            entries[key] = entry
+
+        if changed or entries.keys() != self._entries.keys():
+            self._set_entries(entries)
+            self._save_snapshot()
+
+    def _set_entries(self, entries):
+        self._entries = entries
+        self._games = [entry["game"] for entry in entries.values()]
+        self.version += 1
+
+    def _build_entry(self, folder, fingerprint):
+        config_print, has_main = fingerprint
+        config = self.load_config(folder) if config_print is not None else None
+        return {
+            "fingerprint": fingerprint,
+            "game": build_game_info(folder, config, self.default_emoji, has_main),
+        }
+
+    # ------------------------------------------------------------------
+    # On-disk snapshot
+    # ------------------------------------------------------------------
+
+    def _load_snapshot(self):
+        if not self.snapshot_path or not self.snapshot_path.exists():
+            return
+        try:
+            with open(self.snapshot_path, "r") as file:
+                data = json.load(file)
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable catalog snapshot {self.snapshot_path}: {e}")
+            return
+
+        if data.get("version") != SNAPSHOT_VERSION or data.get("games_dir") != str(self.games_dir):
+            return
+        self._set_entries(dict(sorted(data.get("entries", {}).items())))
+
+    def _save_snapshot(self):
+        if not self.snapshot_path:
+            return
+        data = {
+            "version": SNAPSHOT_VERSION,
+            "games_dir": str(self.games_dir),
+            "entries": self._entries,
+        }
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file first so a crash never leaves half a file
+            tmp_path = self.snapshot_path.with_suffix(".tmp")
+            with open(tmp_path, "w") as file:
+                json.dump(data, file, ensure_ascii=False)
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError as e:
+            print(f"⚠️ Could not save catalog snapshot {self.snapshot_path}: {e}")
+
+
+class _CatalogEventHandler(FileSystemEventHandler):
+    """Forwards watchdog events to GameCatalog.apply_change()."""
+
+    def __init__(self, catalog):
+        super().__init__()
+        self.catalog = catalog
+
+    def on_any_event(self, event):
+        for path in (event.src_path, getattr(event, "dest_path", None)):
+            if path:
+                try:
+                    self.catalog.apply_change(path)
+                except Exception as e:
+                    print(f"⚠️ Catalog update failed for {path}: {e}")
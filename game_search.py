@@ -0,0 +1,145 @@
+"""
+Search index for the game catalog.
+This module builds lookup tables once, so searching, filtering and
+sorting the games doesn't have to look at every game on every keystroke.
+
+- An "inverted index" maps each word to the games that contain it
+  (in the name, description or author).
+- Games are also grouped ("bucketed") by difficulty and by author.
+- Every sort order is computed ahead of time.
+"""
+import re
+from bisect import bisect_left
+
+# The difficulty levels the website knows colors for (see
+# get_difficulty_color in app.py). Anything else goes in "Other".
+DIFFICULTY_LEVELS = ("Easy", "Medium", "Hard")
+OTHER_DIFFICULTY = "Other"
+
+# Sort order name -> label shown on the website
+SORT_ORDERS = {
+    "name": "Name (A → Z)",
+    "name_desc": "Name (Z → A)",
+    "difficulty": "Difficulty (Easy → Hard)",
+    "author": "Author",
+}
+
+_WORD_RE = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """Split text into lowercase words: "Snake Game!" -> ["snake", "game"]"""
+    return _WORD_RE.findall(str(text).lower())
+
+
+def difficulty_level(difficulty):
+    """Map a config's difficulty onto one of DIFFICULTY_LEVELS (or "Other")."""
+    value = str(difficulty).strip().lower()
+    for level in DIFFICULTY_LEVELS:
+        if value == level.lower():
+            return level
+    return OTHER_DIFFICULTY
+
+
+class GameSearchIndex:
+    """
+    A read-only index over a list of game info dictionaries.
+
+    Build it once per catalog change, then call search() as often as you
+    like. Results are lists of the original game dictionaries.
+    """
+
+    def __init__(self, games):
+        self.games = list(games)
+
+        # word -> set of game ids (a game id is its position in self.games)
+        self._postings = {}
+        for game_id, game in enumerate(self.games):
+            text = " ".join(str(game.get(field, "")) for field in ("name", "description", "author"))
+            for token in set(tokenize(text)):
+                self._postings.setdefault(token, set()).add(game_id)
+        # Sorted words let us find every word starting with a prefix
+        self._tokens = sorted(self._postings)
+
+        self._by_difficulty = {}
+        self._by_author = {}
+        for game_id, game in enumerate(self.games):
+            level = difficulty_level(game.get("difficulty", ""))
+            self._by_difficulty.setdefault(level, set()).add(game_id)
+            # str(): a config.json may have "author": null (or a number)
+            self._by_author.setdefault(str(game.get("author", "Unknown")), set()).add(game_id)
+
+        # Every sort order as a list of game ids, plus each id's rank in it
+        level_rank = {level: rank for rank, level in enumerate(DIFFICULTY_LEVELS + (OTHER_DIFFICULTY,))}
+        by_name = sorted(range(len(self.games)), key=lambda i: str(self.games[i].get("name", "")).lower())
+        self._orders = {
+            "name": by_name,
+            "name_desc": by_name[::-1],
+            "difficulty": sorted(
+                by_name, key=lambda i: level_rank[difficulty_level(self.games[i].get("difficulty", ""))]
+            ),
+            "author": sorted(by_name, key=lambda i: str(self.games[i].get("author", "")).lower()),
+        }
+        self._ranks = {
+            name: {game_id: rank for rank, game_id in enumerate(order)}
+            for name, order in self._orders.items()
+        }
+        self._sorted_games = {
+            name: [self.games[i] for i in order] for name, order in self._orders.items()
+        }
+
+    # ------------------------------------------------------------------
+    # Facts for the filter widgets
+    # ------------------------------------------------------------------
+
+    def difficulty_counts(self):
+        """{level: number of games}, in Easy → Hard order."""
+        levels = DIFFICULTY_LEVELS + (OTHER_DIFFICULTY,)
+        return {level: len(self._by_difficulty[level]) for level in levels if level in self._by_difficulty}
+
+    def authors(self):
+        return sorted(self._by_author, key=str.lower)
+
+    # ------------------------------------------------------------------
+    # Searching
+    # ------------------------------------------------------------------
+
+    def _matching_word(self, prefix):
+        """All game ids with a word starting with prefix (as-you-type search)."""
+        ids = set()
+        start = bisect_left(self._tokens, prefix)
+        for token in self._tokens[start:]:
+            if not token.startswith(prefix):
+                break
+            ids |= self._postings[token]
+        return ids
+
+    def search(self, query="", difficulty=None, author=None, sort="name"):
+        """
+        Return the games matching every word in query (each word may be
+        the start of a longer word), the difficulty level and the author.
+        Pass None for a filter to skip it.
+        """
+        order = sort if sort in self._orders else "name"
+        candidates = None
+
+        for word in dict.fromkeys(tokenize(query)):
+            ids = self._matching_word(word)
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return []
+
+        for bucket, value in ((self._by_difficulty, difficulty), (self._by_author, author)):
+            if value is None:
+                continue
+            ids = bucket.get(value, set())
+            candidates = ids if candidates is None else candidates & ids
+            if not candidates:
+                return []
+
+        if candidates is None:
+            # No query and no filters: the whole catalog, already sorted
+            return self._sorted_games[order]
+
+        rank = self._ranks[order]
+        return [self.games[i] for i in sorted(candidates, key=rank.__getitem__)]
@@ -0,0 +1,8 @@
+"""
+Shared helpers for the games in the games/ folder.
+
+Each game adds the project folder to sys.path and then imports the
+modules it needs, for example:
+
+    from game_utils.frame_loop import run_game
+"""
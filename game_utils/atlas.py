@@ -0,0 +1,177 @@
+"""
+Sprite atlases: every picture a game needs, prepared ONCE.
+
+Scaling, flipping and converting images is slow, so a game shouldn't do
+it while it's running. An Atlas does all of that before the first frame:
+every variant (scaled, flipped, converted to the screen's pixel format)
+is packed side by side into one big "page" surface. Drawing a sprite is
+then a plain blit of a small rectangle of that page - no transforms.
+
+    def build(atlas):
+        atlas.add("player", "img/avatar.png", scale=0.5)
+        atlas.add("player_left", "img/avatar.png", scale=0.5, flip_x=True)
+        atlas.add("background", "img/bg.png", size=(800, 600), alpha=False)
+
+    atlas = get_atlas("my_game", build)      # built the first time only
+    atlas.blit(screen, "player_left", (x, y))
+
+Atlases are kept (by name) for the whole program, so restarting a game
+reuses them - until pygame.quit(), which forgets them. They need a
+display mode to be set before they're built.
+
+Games that draw at a smaller size than their logical size (see
+game_utils/render_scale.py) give the atlas a render_scale. Sizes stay in
+logical units (size() and get_rect()), while the pixels on the page are
+made at the render size - so they're shrunk once, not every frame.
+
+    atlas = get_atlas("my_game", build, render_scale=view.scale)
+"""
+import pygame
+
+# Widest an atlas page gets before starting a new row ("shelf")
+MAX_PAGE_WIDTH = 4096
+
+# Empty pixels between packed images
+PADDING = 1
+
+PLACEHOLDER_SIZE = (50, 50)
+PLACEHOLDER_COLOR = (255, 0, 255)  # Magenta: easy to spot!
+
+_atlases = {}
+
+
+def load_surface(path, alpha=True):
+    """Load an image (a magenta square if it can't be loaded)."""
+    try:
+        image = pygame.image.load(path)
+    except (pygame.error, FileNotFoundError) as e:
+        print(f"Error loading image {path}: {e}")
+        image = pygame.Surface(PLACEHOLDER_SIZE, pygame.SRCALPHA)
+        image.fill(PLACEHOLDER_COLOR)
+    return image.convert_alpha() if alpha else image
+
+
+class Atlas:
+    """Named image variants packed into one see-through page and one solid page."""
+
+    def __init__(self, name="atlas", render_scale=1.0):
+        self.name = name
+        self.render_scale = render_scale
+        self._pending = {}  # key -> prepared Surface (until build())
+        self.regions = {}   # key -> (page Surface, Rect on that page)
+        self.sizes = {}     # key -> logical size
+        self.pages = []
+
+    def add(self, key, source, scale=1.0, size=None, flip_x=False, flip_y=False, alpha=True):
+        """
+        Add one variant of an image (a file path or a Surface).
+
+        scale/size  resize it (size wins if both are given)
+        flip_x/y    mirror it left-right / top-bottom
+        alpha       False for solid images like backgrounds
+
+        scale and size are logical; the image is stored at size x render_scale.
+        """
+        image = load_surface(source, alpha) if isinstance(source, str) else source
+        if alpha and not image.get_flags() & pygame.SRCALPHA:
+            image = image.convert_alpha()
+        if size is None and scale != 1:
+            size = (int(image.get_width() * scale), int(image.get_height() * scale))
+        self.sizes[key] = tuple(size) if size is not None else image.get_size()
+        if self.render_scale != 1:
+            width, height = self.sizes[key]
+            size = (max(1, round(width * self.render_scale)), max(1, round(height * self.render_scale)))
+        if size is not None:
+            image = pygame.transform.scale(image, size)
+        if flip_x or flip_y:
+            image = pygame.transform.flip(image, flip_x, flip_y)
+        self._pending[key] = image if alpha else image.convert()
+        return self
+
+    def build(self):
+        """Pack everything added so far into pages."""
+        solid = {k: s for k, s in self._pending.items() if not s.get_flags() & pygame.SRCALPHA}
+        see_through = {k: s for k, s in self._pending.items() if k not in solid}
+        for images, flags in ((see_through, pygame.SRCALPHA), (solid, 0)):
+            if images:
+                self._pack(images, flags)
+        self._pending.clear()
+        return self
+
+    def _pack(self, images, flags):
+        # Shelf packing: tallest first, left to right, new shelf when a row is full
+        order = sorted(images, key=lambda k: images[k].get_height(), reverse=True)
+        page_width = max(min(MAX_PAGE_WIDTH, sum(images[k].get_width() + PADDING for k in order)),
+                         max(images[k].get_width() for k in order))
+        spots = {}
+        x = y = shelf_height = 0
+        for key in order:
+            width, height = images[key].get_size()
+            if x and x + width > page_width:
+                x, y = 0, y + shelf_height + PADDING
+                shelf_height = 0
+            spots[key] = pygame.Rect(x, y, width, height)
+            x += width + PADDING
+            shelf_height = max(shelf_height, height)
+
+        page = pygame.Surface((page_width, y + shelf_height), flags)
+        if flags & pygame.SRCALPHA:
+            page = page.convert_alpha()
+            page.fill((0, 0, 0, 0))
+            # BLEND_RGBA_MAX onto a clear page copies pixels (and alpha) exactly
+            for key, rect in spots.items():
+                page.blit(images[key], rect, special_flags=pygame.BLEND_RGBA_MAX)
+        else:
+            page = page.convert()
+            for key, rect in spots.items():
+                page.blit(images[key], rect)
+
+        self.pages.append(page)
+        for key, rect in spots.items():
+            self.regions[key] = (page, rect)
+
+    def __contains__(self, key):
+        return key in self.regions
+
+    def size(self, key):
+        """A variant's logical size (its pixel size is size() x render_scale)."""
+        return self.sizes[key]
+
+    def get_rect(self, key, **kwargs):
+        """Like Surface.get_rect() for one variant (logical), e.g. get_rect("player", center=(x, y))."""
+        rect = pygame.Rect((0, 0), self.size(key))
+        for name, value in kwargs.items():
+            setattr(rect, name, value)
+        return rect
+
+    def image(self, key):
+        """One variant as a Surface (a view into the page - no copy)."""
+        page, rect = self.regions[key]
+        return page.subsurface(rect)
+
+    def blit(self, target, key, pos):
+        """Draw one variant at pos (in pixels): a blit of just its rectangle of the page."""
+        page, area = self.regions[key]
+        return target.blit(page, pos, area)
+
+
+def get_atlas(name, build, render_scale=1.0):
+    """
+    The atlas called name. The first time, build(atlas) adds its images
+    and it's packed; after that the same atlas is returned. Each
+    render_scale gets its own atlas.
+    """
+    atlas = _atlases.get((name, render_scale))
+    if atlas is None:
+        if not _atlases:
+            # Surfaces made before a pygame.quit() can't be used after it
+            pygame.register_quit(clear_atlases)
+        atlas = Atlas(name, render_scale)
+        build(atlas)
+        _atlases[(name, render_scale)] = atlas.build()
+    return atlas
+
+
+def clear_atlases():
+    """Forget every atlas (done automatically by pygame.quit())."""
+    _atlases.clear()
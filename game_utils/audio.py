@@ -0,0 +1,213 @@
+"""
+🔊 Sounds and music: decoded ONCE, and never holding up the game.
+
+Turning an .mp3 into sound the speakers can play ("decoding") takes time.
+Doing it every time a game starts - or, in the browser, while the page
+waits - makes starting a game slow. This module:
+
+  * keeps every decoded sound effect in a cache until pygame.quit(),
+    so restarting a game (or two games using the same file) decodes it once
+  * decodes in the background, so the first frame doesn't wait for audio
+  * streams music (it's played a bit at a time, never decoded all at once)
+  * prefers ready-made variants next to the original file:
+        die.decoded.wav   written by this module (no decoding at all!)
+        die.ogg           made by hand, e.g. ffmpeg -i die.mp3 die.ogg
+  * keeps quiet if there's no sound card - the game just has no sound
+
+    play_music("songs/theme.mp3", volume=0.5)             # returns straight away
+    hit = preload_sound("songs/hit.mp3", volume=0.5)      # decoding in the background
+    hit.play()                                            # (skipped if not ready yet)
+
+To write .decoded.wav files, set ARCADE_AUDIO_CACHE=1 while playing, or run
+
+    python -m game_utils.audio games/DTS/songs/die.mp3
+"""
+import asyncio
+import os
+import sys
+import threading
+import wave
+
+import pygame
+
+from game_utils.frame_loop import IS_BROWSER
+
+AUDIO_CACHE_ENV = "ARCADE_AUDIO_CACHE"
+
+# die.mp3 -> die.decoded.wav (written by write_decoded)
+DECODED_SUFFIX = ".decoded.wav"
+
+# Ready-made variants, best first: no decoding, then cheap decoding
+SOUND_VARIANTS = (DECODED_SUFFIX, ".ogg")
+MUSIC_VARIANTS = (".ogg",)  # Music streams, so a huge .wav wouldn't help
+
+_sounds = {}                # path -> decoded pygame Sound, for the whole program
+_lock = threading.Lock()    # Background loads share _sounds and the mixer
+
+
+def audio_available():
+    """True if sounds can be played (starts the mixer if needed)."""
+    if pygame.mixer.get_init():
+        return True
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        return False  # No sound card (or no audio in this browser)
+    return True
+
+
+def find_variant(path, suffixes=SOUND_VARIANTS):
+    """The best up-to-date file to load for path: a variant next to it, or path itself."""
+    stem = os.path.splitext(path)[0]
+    try:
+        source_time = os.path.getmtime(path)
+    except OSError:
+        source_time = 0
+    for suffix in suffixes:
+        variant = stem + suffix
+        # An older variant is stale (the original was changed since)
+        if os.path.exists(variant) and os.path.getmtime(variant) >= source_time:
+            return variant
+    return path
+
+
+def write_decoded(path, sound):
+    """
+    Save a decoded sound as path's .decoded.wav so later runs skip decoding.
+    Only works for 16-bit mixers (the usual kind). Returns the new file or None.
+    """
+    frequency, size, channels = pygame.mixer.get_init()
+    if size != -16 or sys.byteorder != "little":
+        return None  # .wav files hold little-endian 16-bit samples
+    target = os.path.splitext(path)[0] + DECODED_SUFFIX
+    try:
+        with wave.open(target, "wb") as file:
+            file.setnchannels(channels)
+            file.setsampwidth(2)
+            file.setframerate(frequency)
+            file.writeframes(sound.get_raw())
+    except OSError as e:
+        print(f"Couldn't write {target}: {e}")
+        return None
+    return target
+
+
+def load_sound(path, volume=None):
+    """
+    The decoded Sound for path (None if there's no audio or it won't load).
+    Decodes the first time only - after that it comes from the cache.
+    """
+    path = os.path.abspath(path)
+    with _lock:
+        sound = _sounds.get(path)
+        if sound is None:
+            if not audio_available():
+                return None
+            source = find_variant(path)
+            try:
+                sound = pygame.mixer.Sound(source)
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Error loading sound {path}: {e}")
+                return None
+            if not _sounds:
+                # Sounds die with the mixer, so pygame.quit() empties the cache
+                pygame.register_quit(clear_sounds)
+            _sounds[path] = sound
+            if source == path and os.environ.get(AUDIO_CACHE_ENV) == "1":
+                write_decoded(path, sound)
+    if volume is not None:
+        sound.set_volume(volume)
+    return sound
+
+
+def run_in_background(func, *args):
+    """
+    Start func(*args) without waiting for it: in a thread on the desktop.
+    The browser has no threads, so there it runs as soon as the current
+    code hands control back to the page (after the game has started).
+    """
+    if IS_BROWSER:
+        asyncio.get_event_loop().call_soon(func, *args)
+    else:
+        threading.Thread(target=func, args=args, daemon=True).start()
+
+
+class PreloadedSound:
+    """A sound effect that decodes in the background. play() skips it until it's ready."""
+
+    def __init__(self, path, volume=None):
+        self.path = path
+        self.volume = volume
+        self.sound = None
+        self._done = threading.Event()
+        run_in_background(self._load)
+
+    def _load(self):
+        try:
+            self.sound = load_sound(self.path, self.volume)
+        finally:
+            self._done.set()
+
+    @property
+    def ready(self):
+        return self.sound is not None
+
+    def wait(self, timeout=None):
+        """Wait for decoding to finish (desktop only); returns the Sound or None."""
+        self._done.wait(timeout)
+        return self.sound
+
+    def play(self, *args, **kwargs):
+        return self.sound.play(*args, **kwargs) if self.sound is not None else None
+
+    def get_length(self, default=0.0):
+        """Length in seconds (default if it isn't loaded)."""
+        return self.sound.get_length() if self.sound is not None else default
+
+
+def preload_sound(path, volume=None):
+    """Start decoding a sound effect in the background (cached, so repeats are instant)."""
+    return PreloadedSound(path, volume)
+
+
+def _start_music(path, volume, loops):
+    with _lock:
+        if not audio_available():
+            return
+        try:
+            pygame.mixer_music.load(find_variant(path, MUSIC_VARIANTS))
+            pygame.mixer_music.set_volume(volume)
+            pygame.mixer_music.play(loops)
+        except (pygame.error, FileNotFoundError) as e:
+            print(f"Error playing music {path}: {e}")
+
+
+def play_music(path, volume=1.0, loops=-1):
+    """Stream a music file (forever, unless loops says otherwise) without waiting for it."""
+    run_in_background(_start_music, os.path.abspath(path), volume, loops)
+
+
+def clear_sounds():
+    """Forget every cached sound (done automatically by pygame.quit())."""
+    with _lock:
+        _sounds.clear()
+
+
+def main(argv=None):
+    """Write a .decoded.wav next to each sound file given on the command line."""
+    paths = sys.argv[1:] if argv is None else argv
+    if not paths:
+        print("usage: python -m game_utils.audio SOUND_FILE...")
+        return 1
+    if not audio_available():
+        print("❌ No audio device - can't decode sounds")
+        return 1
+    for path in paths:
+        sound = load_sound(path)
+        target = write_decoded(os.path.abspath(path), sound) if sound is not None else None
+        print(f"✅ {target}" if target else f"❌ {path} was not written")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
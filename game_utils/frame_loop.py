@@ -0,0 +1,115 @@
+"""
+The game loop, shared by every game.
+
+On the desktop this is the classic blocking loop:
+
+    while running: step(); clock.tick(FPS)
+
+In the browser (Pyodide) a blocking loop would freeze the whole tab -
+the page can't redraw and the Stop button never gets a chance to run.
+There, run_game() starts an asyncio task instead. The task runs one frame,
+then hands control back to the browser until the next frame is due.
+"""
+import asyncio
+import os
+import sys
+
+# True when running inside Pyodide in a web page
+IS_BROWSER = sys.platform == "emscripten"
+
+# The website sets these before starting a game: the game's folder name
+# (window.gameInstances[name] holds its Stop button state) and an id for
+# this particular launch, so an old loop notices when Play is pressed again
+GAME_ID_ENV = "ARCADE_GAME_ID"
+LAUNCH_ID_ENV = "ARCADE_LAUNCH_ID"
+
+# What a should_stop() returns when a newer launch of the same game took
+# over: pygame now belongs to the new game, so the old loop must NOT run its
+# on_exit() (pygame.quit() would tear down the new game's window and caches)
+REPLACED = "replaced"
+
+# Keep references to running tasks so they aren't garbage collected
+_tasks = set()
+
+
+def browser_stop_check():
+    """
+    A should_stop() for the game being started right now: True once the
+    page's Stop button was pressed, REPLACED once a newer launch took over.
+    None if the page didn't say which game this is (nothing to watch).
+    """
+    game_id = os.environ.get(GAME_ID_ENV)
+    if not game_id:
+        return None
+    launch_id = os.environ.get(LAUNCH_ID_ENV)
+    import js
+
+    def stop_requested():
+        instances = getattr(js.window, "gameInstances", None)
+        # gameInstances is a plain JS object: look names up as attributes
+        instance = getattr(instances, game_id, None) if instances is not None else None
+        if instance is None or not instance.running:
+            return True
+        if launch_id is not None and str(getattr(instance, "launchId", "")) != launch_id:
+            return REPLACED
+        return False
+
+    return stop_requested
+
+
+async def run_async(step, fps, should_stop=None, on_exit=None):
+    """
+    Call step() once per frame at a steady fps, yielding to the event loop
+    between frames. Stops when step() returns False, should_stop() returns
+    something true, or the game calls sys.exit(). on_exit() runs at the
+    end - unless should_stop() said REPLACED.
+    """
+    loop = asyncio.get_running_loop()
+    frame_time = 1.0 / fps
+    next_frame = loop.time()
+    replaced = False
+    try:
+        while True:
+            stop = should_stop() if should_stop else False
+            if stop:
+                replaced = stop == REPLACED
+                break
+            if step() is False:
+                break
+
+            next_frame += frame_time
+            delay = next_frame - loop.time()
+            if delay < 0:
+                # Running behind - don't try to "catch up" with a burst of frames
+                next_frame = loop.time()
+                delay = 0
+            await asyncio.sleep(delay)
+    except SystemExit:
+        pass
+    finally:
+        if on_exit and not replaced:
+            try:
+                on_exit()
+            except SystemExit:
+                pass
+
+
+def run_game(step, fps, clock=None, on_exit=None):
+    """
+    Run a game: step() does one frame (input, update, draw) and returns
+    False to stop. on_exit() runs once when the loop ends.
+
+    Desktop: blocks until the game ends.
+    Browser: starts the loop as a background task and returns it.
+    """
+    if IS_BROWSER:
+        task = asyncio.ensure_future(run_async(step, fps, browser_stop_check(), on_exit))
+        _tasks.add(task)
+        task.add_done_callback(_tasks.discard)
+        return task
+
+    while step() is not False:
+        clock.tick(fps)
+    if on_exit:
+        on_exit()
+    return None
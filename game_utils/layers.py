@@ -0,0 +1,87 @@
+"""
+Prebaked layers: things that look the same every frame.
+
+Grid lines, a dimmed "game over" shade or a background picture never
+change, yet drawing them again each frame costs dozens of draw calls (or
+a brand new Surface). A LayerCache draws each layer ONCE into its own
+surface and afterwards just blits it - one fast copy per frame.
+
+    layers = LayerCache()
+    layers.add("grid", lambda: grid_lines((400, 600), 30, 10, 20, GRAY))
+    layers.add("shade", lambda: shade((400, 600), BLACK, 128))
+
+    layers.blit(screen, "grid")      # built the first time, reused after
+
+If something a layer shows changes (new window size, new theme...), call
+layers.invalidate("grid") and it is rebuilt on its next use.
+"""
+import pygame
+
+# Color used for the "see-through" parts of line layers. Any color that
+# the layer itself never draws with works.
+TRANSPARENT_KEY = (255, 0, 255)
+
+
+class LayerCache:
+    """Named surfaces, each built once by its build() function."""
+
+    def __init__(self):
+        self._builders = {}  # name -> function that returns a Surface
+        self._surfaces = {}  # name -> built Surface
+
+    def add(self, name, build):
+        """Register a layer. build() is only called when it's first needed."""
+        self._builders[name] = build
+        self._surfaces.pop(name, None)
+
+    def get(self, name):
+        """The layer's surface (building it if needed)."""
+        surface = self._surfaces.get(name)
+        if surface is None:
+            surface = self._surfaces[name] = _prepare(self._builders[name]())
+        return surface
+
+    def blit(self, target, name, pos=(0, 0)):
+        """Draw a layer onto target; returns the changed rectangle."""
+        return target.blit(self.get(name), pos)
+
+    def invalidate(self, name=None):
+        """Forget one built layer (or all of them) so it's rebuilt next time."""
+        if name is None:
+            self._surfaces.clear()
+        else:
+            self._surfaces.pop(name, None)
+
+
+def _prepare(surface):
+    """Convert to the screen's pixel format (if there is a screen) for fast blits."""
+    if pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+def grid_lines(size, cell_size, columns, rows, color, width=1):
+    """
+    A see-through layer with grid lines: columns + 1 vertical lines as tall
+    as the layer and rows + 1 horizontal lines as wide as the layer.
+    """
+    surface = pygame.Surface(size)
+    surface.fill(TRANSPARENT_KEY)
+    layer_width, layer_height = size
+    for i in range(columns + 1):
+        pygame.draw.line(surface, color, (i * cell_size, 0), (i * cell_size, layer_height), width)
+    for i in range(rows + 1):
+        pygame.draw.line(surface, color, (0, i * cell_size), (layer_width, i * cell_size), width)
+    # RLEACCEL makes blitting a mostly see-through surface very cheap
+    surface.set_colorkey(TRANSPARENT_KEY, pygame.RLEACCEL)
+    return surface
+
+
+def shade(size, color, alpha):
+    """A solid, semi-transparent layer (alpha 0 = invisible, 255 = solid)."""
+    surface = pygame.Surface(size)
+    surface.fill(color)
+    surface.set_alpha(alpha)
+    return surface
@@ -0,0 +1,182 @@
+"""
+Opt-in performance tools for the game loops.
+
+Turn them on with the ARCADE_PROFILE environment variable:
+
+    ARCADE_PROFILE=1 python games/snake/main.py         # record timings
+    ARCADE_PROFILE=overlay python games/snake/main.py   # ...and show the overlay
+
+While a game runs:
+
+    F3   show/hide the overlay (FPS, time per phase, frame budget)
+    F9   start/stop a cProfile capture; stopping saves a .prof file
+         and prints the slowest functions
+
+When profiling is off, every call here is a cheap no-op.
+"""
+import cProfile
+import os
+import pstats
+import time
+from collections import deque
+from contextlib import nullcontext
+
+import pygame
+
+from game_utils.text import get_font
+
+PROFILE_ENV = "ARCADE_PROFILE"
+
+OVERLAY_KEY = pygame.K_F3
+CAPTURE_KEY = pygame.K_F9
+
+# Overlay colors
+TEXT_COLOR = (255, 255, 255)
+BACK_COLOR = (0, 0, 0, 170)
+OK_COLOR = (0, 200, 0)
+SLOW_COLOR = (230, 50, 50)
+
+_OFF = nullcontext()
+
+
+class _Timer:
+    """Context manager that appends its duration to a ring buffer."""
+
+    __slots__ = ("samples", "start")
+
+    def __init__(self, samples):
+        self.samples = samples
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.samples.append(time.perf_counter() - self.start)
+        return False
+
+
+class FrameProfiler:
+    """
+    Times each phase of every frame and keeps the most recent samples.
+
+        with profiler.frame():
+            with profiler.phase("input"):
+                handle_input()
+            ...
+    """
+
+    def __init__(self, name="game", fps=60, history=120, enabled=None, overlay=None):
+        setting = os.environ.get(PROFILE_ENV, "").strip().lower()
+        self.enabled = enabled if enabled is not None else setting not in ("", "0", "false", "no")
+        self.show_overlay = overlay if overlay is not None else setting == "overlay"
+        self.name = name
+        self.budget = 1.0 / fps
+        self.history = history
+
+        self.frame_times = deque(maxlen=history)
+        self._frame_timer = _Timer(self.frame_times)
+        self._phases = {}  # phase name -> _Timer (its samples are the ring buffer)
+        self._overlay = None
+        self._capture = None
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def frame(self):
+        """Wrap a whole frame."""
+        return self._frame_timer if self.enabled else _OFF
+
+    def phase(self, name):
+        """Wrap one phase of a frame (input, update, draw, ...)."""
+        if not self.enabled:
+            return _OFF
+        timer = self._phases.get(name)
+        if timer is None:
+            timer = self._phases[name] = _Timer(deque(maxlen=self.history))
+        return timer
+
+    def stats(self):
+        """{phase: {"avg_ms", "max_ms"}} over the recent samples, plus "frame"."""
+        result = {}
+        buffers = [(name, timer.samples) for name, timer in self._phases.items()]
+        for name, samples in buffers + [("frame", self.frame_times)]:
+            if samples:
+                result[name] = {
+                    "avg_ms": sum(samples) / len(samples) * 1000,
+                    "max_ms": max(samples) * 1000,
+                }
+        return result
+
+    # ------------------------------------------------------------------
+    # Hotkeys
+    # ------------------------------------------------------------------
+
+    def handle_event(self, event):
+        """Call for every event; handles the F3 / F9 hotkeys."""
+        if not self.enabled or event.type != pygame.KEYDOWN:
+            return
+        if event.key == OVERLAY_KEY:
+            self.show_overlay = not self.show_overlay
+        elif event.key == CAPTURE_KEY:
+            if self._capture is None:
+                self.start_capture()
+            else:
+                self.stop_capture()
+
+    def start_capture(self):
+        self._capture = cProfile.Profile()
+        self._capture.enable()
+        print("🔬 cProfile capture started (press F9 again to save it)")
+
+    def stop_capture(self, top=15):
+        """Stop the cProfile capture, save it, print the slowest functions."""
+        if self._capture is None:
+            return None
+        self._capture.disable()
+        path = f"profile-{self.name}-{time.strftime('%Y%m%d-%H%M%S')}.prof"
+        self._capture.dump_stats(path)
+        pstats.Stats(self._capture).sort_stats("cumulative").print_stats(top)
+        self._capture = None
+        print(f"💾 cProfile capture saved to {path} (open it with: python -m pstats {path})")
+        return path
+
+    # ------------------------------------------------------------------
+    # Overlay
+    # ------------------------------------------------------------------
+
+    @property
+    def overlay_visible(self):
+        return self.enabled and self.show_overlay
+
+    def draw_overlay(self, surface, pos=None):
+        """
+        Draw FPS, per-phase times and a frame-budget bar (before flipping).
+        Goes in the top-right corner unless pos is given.
+        """
+        if not (self.enabled and self.show_overlay and self.frame_times):
+            return
+        font = get_font(20)
+        stats = self.stats()
+        frame_avg = stats["frame"]["avg_ms"]
+        lines = [f"{1000 / frame_avg:6.0f} FPS (work only)" if frame_avg else "  -- FPS"]
+        lines += [f"{name:<7}{s['avg_ms']:6.2f} ms  max {s['max_ms']:6.2f}" for name, s in stats.items()]
+
+        line_height = font.get_linesize()
+        width, height = 220, line_height * len(lines) + 18
+        if self._overlay is None or self._overlay.get_size() != (width, height):
+            self._overlay = pygame.Surface((width, height), pygame.SRCALPHA)
+        self._overlay.fill(BACK_COLOR)
+        for i, line in enumerate(lines):
+            # Numbers change every frame, so render directly (not via the text cache)
+            self._overlay.blit(font.render(line, True, TEXT_COLOR), (6, 4 + i * line_height))
+
+        # Budget bar: how much of one frame's time (1/FPS) the work used
+        used = min(1.0, frame_avg / 1000 / self.budget)
+        color = OK_COLOR if used < 0.8 else SLOW_COLOR
+        pygame.draw.rect(self._overlay, color, (6, height - 10, int((width - 12) * used), 6))
+        if pos is None:
+            pos = (surface.get_width() - width - 10, 10)
+        surface.blit(self._overlay, pos)
@@ -0,0 +1,119 @@
+"""
+Resolution-independent rendering: one game size, any window size.
+
+A game works in LOGICAL units - positions, speeds and collisions all use
+one fixed size (say 2000x1080), no matter how big the window really is.
+A Viewport turns those logical units into pixels:
+
+    render size   how many pixels the game actually draws into each frame
+    window size   how big the window on screen is
+
+Drawing 2000x1080 pixels every frame is a lot of work for a small kiosk
+PC or the 800-pixel-wide canvas on the website. With a render scale of
+0.5 the game draws only 1000x540 pixels (a quarter of the work!), and if
+the window is bigger, the finished frame is stretched to fit it in ONE
+scale step when it's shown.
+
+    view = Viewport((2000, 1080))              # sizes come from the settings below
+    screen = view.surface                       # draw here, at the render size
+    screen.blit(image, view.point(rect.topleft))
+    pygame.draw.rect(screen, RED, view.rect(rect), view.length(2))
+    view.present()                              # instead of pygame.display.flip()
+
+Settings (environment variables, as numbers like 0.5):
+
+    ARCADE_RENDER_SCALE   render size = logical size x this
+                          (default 1, or "fit 800 pixels wide" in the browser)
+    ARCADE_WINDOW_SCALE   window size = logical size x this
+                          (default: the same as the render scale)
+"""
+import os
+
+import pygame
+
+from game_utils.frame_loop import IS_BROWSER
+
+RENDER_SCALE_ENV = "ARCADE_RENDER_SCALE"
+WINDOW_SCALE_ENV = "ARCADE_WINDOW_SCALE"
+
+# Width of the game canvas on the website
+BROWSER_WIDTH = 800
+
+
+def env_scale(name, default):
+    """A scale from the environment variable name (default if unset or invalid)."""
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        scale = float(value)
+    except ValueError:
+        scale = 0
+    if scale <= 0:
+        print(f"Ignoring {name}={value!r} (expected a number above 0)")
+        return default
+    return scale
+
+
+class Viewport:
+    """Maps a fixed logical game size onto a render surface and a window."""
+
+    def __init__(self, logical_size, render_scale=None, window_scale=None, smooth=False):
+        """
+        logical_size   the size the game's logic uses, e.g. (2000, 1080)
+        render_scale   render size / logical size (None: from the environment)
+        window_scale   window size / logical size (None: from the environment)
+        smooth         smooth (not blocky) stretching when sizes differ -
+                       much slower: about 10 ms instead of 1 ms for 1000x540 -> 2000x1080
+        """
+        self.logical_size = tuple(logical_size)
+        if render_scale is None:
+            default = min(1.0, BROWSER_WIDTH / self.logical_size[0]) if IS_BROWSER else 1.0
+            render_scale = env_scale(RENDER_SCALE_ENV, default)
+        if window_scale is None:
+            window_scale = env_scale(WINDOW_SCALE_ENV, render_scale)
+        self.scale = render_scale
+        self.smooth = smooth
+
+        self.size = self._scaled_size(render_scale)
+        self.window_size = self._scaled_size(window_scale)
+        self.window = pygame.display.set_mode(self.window_size)
+        if self.window_size == self.size:
+            # Nothing to stretch: draw straight into the window
+            self.surface = self.window
+        else:
+            self.surface = pygame.Surface(self.size).convert()
+
+    def _scaled_size(self, scale):
+        width, height = self.logical_size
+        return max(1, round(width * scale)), max(1, round(height * scale))
+
+    def length(self, value):
+        """A logical length (a size, a line width...) in render pixels - never 0 unless value is."""
+        if not value:
+            return 0
+        return max(1, round(value * self.scale))
+
+    def point(self, pos):
+        """A logical (x, y) in render pixels."""
+        scale = self.scale
+        return round(pos[0] * scale), round(pos[1] * scale)
+
+    def rect(self, rect):
+        """A logical Rect in render pixels."""
+        rect = pygame.Rect(rect)
+        return pygame.Rect(self.point(rect.topleft), (self.length(rect.width), self.length(rect.height)))
+
+    def to_logical(self, window_pos):
+        """A window position (like a mouse click) in logical units."""
+        return (window_pos[0] * self.logical_size[0] // self.window_size[0],
+                window_pos[1] * self.logical_size[1] // self.window_size[1])
+
+    def present(self):
+        """Show the finished frame (stretched to the window if needed)."""
+        if self.surface is not self.window:
+            if self.smooth and self.surface.get_bitsize() in (24, 32):
+                pygame.transform.smoothscale(self.surface, self.window_size, self.window)
+            else:
+                pygame.transform.scale(self.surface, self.window_size, self.window)
+        pygame.display.flip()
@@ -0,0 +1,161 @@
+"""
+A spatial hash: find what's near something without checking everything.
+
+The screen is split into a grid of square cells (cell_size pixels wide).
+Every object is filed under each cell its rectangle touches. To find
+what overlaps a rectangle, we only look in the cells that rectangle
+touches - so a query costs the same whether there are 10 or 10,000
+objects elsewhere on the screen.
+
+    hash = SpatialHash(cell_size=128)
+    hash.insert(enemy, enemy.rect)
+    hash.move(enemy, enemy.rect)          # after it moved
+    hits = hash.query_rect(player.rect)   # same result as Rect.colliderect
+
+For sprites there's SpatialGroup: a pygame sprite Group that keeps its
+own hash up to date as sprites are added, moved (in update()) and killed.
+
+    enemies = SpatialGroup(cell_size=128)
+    enemies.add(Enemy(...))
+    enemies.update()
+    hit = enemies.collide(player.rect, dokill=True)   # like spritecollide
+"""
+import pygame
+
+
+class SpatialHash:
+    """A uniform grid of buckets holding (item, rect) pairs."""
+
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self._buckets = {}  # (cell x, cell y) -> {item: None} (an ordered set)
+        self._items = {}    # item -> (its Rect, the cells it's filed under)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item):
+        return item in self._items
+
+    def _cells(self, rect):
+        """Every (cell x, cell y) a rectangle touches (right/bottom edges are exclusive)."""
+        size = self.cell_size
+        left, top = rect.left // size, rect.top // size
+        right = max(rect.left, rect.right - 1) // size
+        bottom = max(rect.top, rect.bottom - 1) // size
+        if left == right and top == bottom:
+            return ((left, top),)  # The usual case for small objects
+        return tuple((cx, cy) for cx in range(left, right + 1) for cy in range(top, bottom + 1))
+
+    def insert(self, item, rect):
+        if item in self._items:
+            self.move(item, rect)
+            return
+        cells = self._cells(rect)
+        self._items[item] = (pygame.Rect(rect), cells)
+        for cell in cells:
+            self._buckets.setdefault(cell, {})[item] = None
+
+    def remove(self, item):
+        entry = self._items.pop(item, None)
+        if entry is None:
+            return
+        for cell in entry[1]:
+            bucket = self._buckets[cell]
+            del bucket[item]
+            if not bucket:
+                del self._buckets[cell]
+
+    def move(self, item, rect):
+        """Update an item's rectangle (only re-files it if its cells changed)."""
+        entry = self._items.get(item)
+        if entry is None:
+            self.insert(item, rect)
+            return
+        stored, cells = entry
+        stored.update(rect)
+        new_cells = self._cells(rect)
+        if new_cells == cells:
+            return
+        for cell in cells:
+            bucket = self._buckets[cell]
+            del bucket[item]
+            if not bucket:
+                del self._buckets[cell]
+        for cell in new_cells:
+            self._buckets.setdefault(cell, {})[item] = None
+        self._items[item] = (stored, new_cells)
+
+    def clear(self):
+        self._buckets.clear()
+        self._items.clear()
+
+    def candidates(self, rect):
+        """Items in the cells rect touches (they MIGHT overlap it)."""
+        buckets = self._buckets
+        found = {}
+        for cell in self._cells(rect):
+            bucket = buckets.get(cell)
+            if bucket:
+                found.update(bucket)
+        return found.keys()
+
+    def query_rect(self, rect):
+        """Items whose rectangle overlaps rect (exactly like Rect.colliderect)."""
+        rect = pygame.Rect(rect)
+        items = self._items
+        return [item for item in self.candidates(rect) if rect.colliderect(items[item][0])]
+
+    def query_radius(self, center, radius):
+        """Items whose rectangle is within radius of center (any part of it)."""
+        cx, cy = center
+        area = pygame.Rect(cx - radius, cy - radius, 2 * radius + 1, 2 * radius + 1)
+        items = self._items
+        limit = radius * radius
+        found = []
+        for item in self.candidates(area):
+            rect = items[item][0]
+            # Distance from the center to the closest point of the rectangle
+            dx = cx - max(rect.left, min(cx, rect.right - 1))
+            dy = cy - max(rect.top, min(cy, rect.bottom - 1))
+            if dx * dx + dy * dy <= limit:
+                found.append(item)
+        return found
+
+
+class SpatialGroup(pygame.sprite.Group):
+    """A sprite Group that files its sprites (by sprite.rect) in a SpatialHash."""
+
+    def __init__(self, *sprites, cell_size=128):
+        self.hash = SpatialHash(cell_size)
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self.hash.insert(sprite, sprite.rect)
+
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self.hash.remove(sprite)
+
+    def update(self, *args, **kwargs):
+        """Update every sprite, then re-file the ones that moved."""
+        super().update(*args, **kwargs)
+        for sprite in self.sprites():
+            self.hash.move(sprite, sprite.rect)
+
+    def refresh(self, sprite):
+        """Call after moving a sprite outside of update()."""
+        self.hash.move(sprite, sprite.rect)
+
+    def collide(self, rect, dokill=False):
+        """Sprites overlapping rect - like spritecollide(), but only checks nearby sprites."""
+        hits = self.hash.query_rect(rect)
+        if dokill:
+            for sprite in hits:
+                sprite.kill()
+        return hits
+
+    def near(self, center, radius):
+        """Sprites within radius of center."""
+        return self.hash.query_radius(center, radius)
@@ -0,0 +1,68 @@
+"""
+Text drawing helpers with caching.
+
+Making a pygame Font loads and parses a font file, and rendering text
+rasterizes every letter - both are slow to do 60 times a second. Games
+usually show the same few strings ("Score: 12", "GAME OVER") over and
+over, so this module remembers:
+
+- every Font it has made, by (name, size)
+- the most recently rendered text surfaces, by (font, text, color)
+
+    from game_utils.text import render_text
+    screen.blit(render_text(f"Score: {score}", 36, WHITE), (10, 10))
+
+Old Font objects stop working after pygame.quit(), so the cache empties
+itself when pygame quits (the next game gets fresh fonts).
+"""
+from collections import OrderedDict
+
+import pygame
+
+# How many rendered text surfaces to keep
+TEXT_CACHE_SIZE = 256
+
+_fonts = {}
+_surfaces = OrderedDict()
+
+
+def get_font(size, name=None, sysfont=False):
+    """
+    A cached pygame Font. name=None is pygame's default font; with
+    sysfont=True, name is a system font like "Arial".
+    """
+    key = (name, size, sysfont)
+    font = _fonts.get(key)
+    if font is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        if not _fonts:
+            # Quit hooks only last until the next quit, so register again each time
+            pygame.register_quit(clear_text_cache)
+        font = pygame.font.SysFont(name, size) if sysfont else pygame.font.Font(name, size)
+        _fonts[key] = font
+    return font
+
+
+def render_text(text, size, color, name=None, sysfont=False, antialias=True):
+    """
+    A rendered text surface, reused if this exact text was drawn recently.
+    Treat the result as read-only - it's shared!
+    """
+    key = (name, size, sysfont, text, tuple(color), antialias)
+    surface = _surfaces.get(key)
+    if surface is not None:
+        _surfaces.move_to_end(key)  # Mark as recently used
+        return surface
+
+    surface = get_font(size, name, sysfont).render(text, antialias, color)
+    _surfaces[key] = surface
+    if len(_surfaces) > TEXT_CACHE_SIZE:
+        _surfaces.popitem(last=False)  # Forget the least recently used
+    return surface
+
+
+def clear_text_cache():
+    """Forget every Font and rendered text (done automatically by pygame.quit())."""
+    _fonts.clear()
+    _surfaces.clear()
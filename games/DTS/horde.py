@@ -0,0 +1,159 @@
+"""
+🧟 A zombie HORDE - thousands of enemies, moved all at once with NumPy.
+
+The normal game keeps every enemy as its own Sprite object, and every
+frame Python calls update() on each one. That's fine for 10 enemies,
+but far too slow for 5000.
+
+A Horde keeps the enemies as a "structure of arrays": one NumPy array
+for all the x positions, one for all the y positions, one for speeds
+and one for "still alive?" flags. Moving the whole horde is then ONE
+line that NumPy runs in fast compiled code:
+
+    x -= speed          # every zombie moves left at once!
+
+Positions are the enemies' hitboxes (the image rect shrunk by HITBOX_SHRINK
+pixels, like Enemy does with inflate(-20, -20)), and the image is drawn at
+the hitbox's top-left corner - exactly like the sprite version.
+
+Positions are in logical units (see game_utils/render_scale.py). When the
+game draws at a smaller size, draw() scales every position at once too.
+
+NumPy is optional: if it isn't installed, HAVE_NUMPY is False and the
+game sticks to sprites.
+"""
+from itertools import repeat
+
+import pygame
+
+try:
+    import numpy as np
+    HAVE_NUMPY = True
+except ImportError:  # The sprite version still works without it
+    np = None
+    HAVE_NUMPY = False
+
+# Enemy.rect is the image rect shrunk by this much (rect.inflate(-20, -20))
+HITBOX_SHRINK = 20
+HITBOX_COLOR = (255, 0, 0)
+
+
+class Horde:
+    """Every enemy's position, speed and alive flag, in NumPy arrays"""
+
+    def __init__(self, image, capacity=1024, draw_hitboxes=True, size=None, scale=1.0):
+        """
+        image   what one zombie looks like (drawn at the render size)
+        size    the image's logical size (default: image's own size)
+        scale   render pixels per logical unit
+        """
+        if not HAVE_NUMPY:
+            raise RuntimeError("Horde needs NumPy (pip install numpy)")
+        self.image_width, self.image_height = size or image.get_size()
+        self.width = self.image_width - HITBOX_SHRINK    # Hitbox size
+        self.height = self.image_height - HITBOX_SHRINK
+        self.scale = scale
+
+        # What one zombie looks like: the image, plus its hitbox outline
+        # drawn on top ONCE here instead of for every zombie every frame
+        self.sprite = image.copy()
+        if draw_hitboxes:
+            hitbox = [max(1, round(length * scale)) for length in (self.width, self.height, 2)]
+            pygame.draw.rect(self.sprite, HITBOX_COLOR, (0, 0, hitbox[0], hitbox[1]), hitbox[2])
+        # RLE ("run-length encoding") skips the see-through pixels in runs
+        # instead of blending them one by one: ~10x faster blits
+        self.sprite.set_alpha(255, pygame.RLEACCEL)
+
+        self.count = 0  # Slots in use (alive or waiting to be cleaned up)
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        old = self.count
+        x, y, speed, alive = (getattr(self, name, None) for name in ("x", "y", "speed", "alive"))
+        self.x = np.zeros(capacity, dtype=np.int64)   # Hitbox left
+        self.y = np.zeros(capacity, dtype=np.int64)   # Hitbox top
+        self.speed = np.zeros(capacity, dtype=np.int64)
+        self.alive = np.zeros(capacity, dtype=bool)
+        if old:
+            self.x[:old], self.y[:old] = x[:old], y[:old]
+            self.speed[:old], self.alive[:old] = speed[:old], alive[:old]
+
+    def __len__(self):
+        return int(np.count_nonzero(self.alive[:self.count]))
+
+    def empty(self):
+        """Remove every enemy (like Group.empty())"""
+        self.alive[:self.count] = False
+        self.count = 0
+
+    def spawn(self, centers_x, centers_y, speeds):
+        """
+        Add many enemies at once. Like Enemy, each one is centered on
+        (centers_x[i], centers_y[i]) before its hitbox is shrunk.
+        """
+        centers_x = np.asarray(centers_x, dtype=np.int64)
+        n = len(centers_x)
+        if self.count + n > len(self.x):
+            self._allocate(max(2 * len(self.x), self.count + n))
+        new = slice(self.count, self.count + n)
+        # rect.center = (x, y), then inflate(-20, -20) moves the corner in by 10
+        self.x[new] = centers_x - self.image_width // 2 + HITBOX_SHRINK // 2
+        self.y[new] = np.asarray(centers_y, dtype=np.int64) - self.image_height // 2 + HITBOX_SHRINK // 2
+        self.speed[new] = speeds
+        self.alive[new] = True
+        self.count += n
+
+    def update(self):
+        """Move every enemy left; forget the ones that left the screen"""
+        n = self.count
+        self.x[:n] -= self.speed[:n]
+        # Gone off the left side? (rect.right < 0)
+        self.alive[:n] &= self.x[:n] + self.width >= 0
+        self._compact()
+
+    def collide(self, rect):
+        """
+        Remove every enemy whose hitbox overlaps rect (same rules as
+        Rect.colliderect) and return how many there were.
+        """
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        hit = (self.alive[:n]
+               & (x < rect.right) & (x + self.width > rect.left)
+               & (y < rect.bottom) & (y + self.height > rect.top))
+        hits = int(np.count_nonzero(hit))
+        if hits:
+            self.alive[:n] &= ~hit
+            self._compact()
+        return hits
+
+    def _compact(self):
+        """Squeeze the living enemies to the front of the arrays (keeping their order)"""
+        n = self.count
+        alive = self.alive[:n]
+        if alive.all():
+            return
+        keep = np.flatnonzero(alive)
+        k = len(keep)
+        self.x[:k], self.y[:k], self.speed[:k] = self.x[keep], self.y[keep], self.speed[keep]
+        self.alive[:k] = True
+        self.alive[k:n] = False
+        self.count = k
+
+    def draw(self, surface):
+        """Draw every enemy that's on the surface with ONE blits() call"""
+        n = self.count
+        if n:
+            x, y = self.x[:n], self.y[:n]
+            if self.scale != 1:
+                x = np.rint(x * self.scale).astype(np.int64)
+                y = np.rint(y * self.scale).astype(np.int64)
+            # Zombies still waiting off-screen to the right would each cost
+            # a blit that draws nothing - leave them out
+            width, height = surface.get_size()
+            sprite_width, sprite_height = self.sprite.get_size()
+            visible = (x < width) & (x + sprite_width > 0) & (y < height) & (y + sprite_height > 0)
+            if not visible.all():
+                x, y = x[visible], y[visible]
+            positions = zip(x.tolist(), y.tolist())
+            surface.blits(zip(repeat(self.sprite), positions), doreturn=False)
@@ -9,33 +9,73 @@ import sys
 import os
 import random
 
+# Let this game find the shared helpers in game_utils/ (two folders up)
+PROJECT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
+
+from game_utils.atlas import get_atlas
+from game_utils.audio import play_music, preload_sound
+from game_utils.frame_loop import run_game
+from game_utils.layers import LayerCache, shade
+from game_utils.profiling import FrameProfiler
+from game_utils.render_scale import Viewport
+from game_utils.spatial_hash import SpatialGroup
+from game_utils.text import render_text
+
+from horde import HAVE_NUMPY, Horde, np
+
 # Game settings
 FPS = 60
+# The game's LOGICAL size: positions, speeds and collisions all use these
+# units. The window can be drawn smaller or bigger - set ARCADE_RENDER_SCALE
+# and ARCADE_WINDOW_SCALE (see game_utils/render_scale.py)
 SCREEN_WIDTH = 2000
 SCREEN_HEIGHT = 1080
 
+# UI text settings (system font name and size)
+FONT_NAME = "Arial"
+FONT_SIZE = 50
+
+# Enemies: "sprites" (one Sprite per enemy) or "horde" (NumPy arrays, for
+# thousands of zombies - see horde.py). Horde mode needs NumPy.
+ENEMY_MODE = os.environ.get("ARCADE_DTS_ENEMIES", "sprites")
+MAX_ENEMIES = 10            # Sprite mode: spawning stops at this many
+HORDE_MAX_ENEMIES = 5000    # Horde mode: ...and at this many
+# ...but at full size (render scale 1) only about this many zombies can be
+# drawn in one 60 FPS frame. Smaller render sizes fit more (1 / scale²).
+HORDE_FULL_SIZE_MAX = 2500
+HORDE_SPAWN_BATCH = 250     # Horde mode: enemies per spawn
+
+# Game states: PLAYING -> (hit!) DYING -> (death sound over) GAME_OVER
+# -> (SPACE) PLAYING again. The loop never stops while the sound plays.
+PLAYING = "playing"
+DYING = "dying"
+GAME_OVER = "game_over"
+
+# How long DYING lasts if the death sound isn't loaded (no sound card, or
+# it's still decoding); otherwise it lasts as long as the sound
+DYING_TIME = 1500  # milliseconds
+
+# Sprite mode keeps enemies in a spatial hash (see game_utils/spatial_hash.py)
+# with cells about the size of one zombie
+ENEMY_CELL_SIZE = 128
+
 class DTSGame:
     def __init__(self):
         # Initialize pygame
         pygame.init()
         
-        # Game window setup
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        # Game window setup: everything is drawn into self.screen at the
+        # render size, then the viewport shows it in the window
+        self.viewport = Viewport((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.screen = self.viewport.surface
         pygame.display.set_caption("Dodge The Squares")
         self.clock = pygame.time.Clock()
         self.running = True
         
-        # Game state
-        self.level = 1
-        self.score = 0
-        self.spawn_rate = 40
-        self.spawn_counter = 0
-        
-        # Player controls
-        self.moving_left = False
-        self.moving_right = False
-        self.moving_up = False
-        self.moving_down = False
+        # Optional timing tools (ARCADE_PROFILE=1, F3 = overlay, F9 = cProfile)
+        self.profiler = FrameProfiler("DTS", FPS)
         
         # Game directories
         self.game_dir = os.path.dirname(os.path.abspath(__file__))
@@ -44,59 +84,80 @@ class DTSGame:
         self.load_assets()
         
         # Initialize game objects
-        self.enemies = pygame.sprite.Group()
+        self.horde_mode = ENEMY_MODE == "horde" and HAVE_NUMPY
+        if ENEMY_MODE == "horde" and not HAVE_NUMPY:
+            print("NumPy isn't installed - using sprite enemies instead of a horde")
+        if self.horde_mode:
+            self.enemies = Horde(self.enemy_img, size=self.atlas.size("zombie"),
+                                 scale=self.viewport.scale)
+            self.max_enemies = min(HORDE_MAX_ENEMIES, int(HORDE_FULL_SIZE_MAX / self.viewport.scale ** 2))
+            self.spawn_batch = HORDE_SPAWN_BATCH
+        else:
+            self.enemies = SpatialGroup(cell_size=ENEMY_CELL_SIZE)
+            self.max_enemies, self.spawn_batch = MAX_ENEMIES, 1
         self.all_sprites = pygame.sprite.Group()
+        
+        # The game-over shade is made once and reused
+        self.layers = LayerCache()
+        self.layers.add("shade", lambda: shade(self.viewport.size, (0, 0, 0), 128))
+        
+        self.reset()
+    
+    def reset(self):
+        """Start a new game (images and sounds are already loaded, so this is instant)"""
+        # Game state
+        self.state = PLAYING
+        self.state_started = pygame.time.get_ticks()
+        self.level = 1
+        self.score = 0
+        self.spawn_rate = 40
+        self.spawn_counter = 0
+        
+        # Player controls (keys still held down keep working)
+        pressed = pygame.key.get_pressed()
+        self.moving_left = bool(pressed[pygame.K_LEFT] or pressed[pygame.K_a])
+        self.moving_right = bool(pressed[pygame.K_RIGHT] or pressed[pygame.K_d])
+        self.moving_up = bool(pressed[pygame.K_UP] or pressed[pygame.K_w])
+        self.moving_down = bool(pressed[pygame.K_DOWN] or pressed[pygame.K_s])
+        
         self.player = self.create_player()
         self.create_level(self.level)
     
+    def set_state(self, state):
+        self.state = state
+        self.state_started = pygame.time.get_ticks()
+    
     def load_assets(self):
         """Load all game assets (images, sounds, etc.)"""
-        # Load and play background music
-        sound = os.path.join(self.game_dir, "songs", "sound.mp3")
-        pygame.mixer_music.load(sound)
-        pygame.mixer_music.set_volume(0.5)
-        pygame.mixer_music.play(-1)
+        # Sounds load in the background and are decoded only once for the
+        # whole program, so the game starts without waiting for them
+        # (see game_utils/audio.py). The music streams as it plays.
+        songs_dir = os.path.join(self.game_dir, "songs")
+        play_music(os.path.join(songs_dir, "sound.mp3"), volume=0.5)
+        self.hit_sound = preload_sound(os.path.join(songs_dir, "die.mp3"), volume=0.5)
         
-        # Load sound effects
-        self.hit_sound = pygame.mixer.Sound(os.path.join(self.game_dir, "songs", "die.mp3"))
-        
-        # Load fonts
-        self.font = pygame.font.SysFont("Arial", 50)
-        
-        # Load images
-        self.enemy_img = self.load_image("zomB.png")
-        self.player_img = self.load_image("avatar.png")
-        self.background = self.load_background()
-    
-    def load_image(self, name, scale=0.5):
-        """Load and scale an image from the img directory"""
-        image_path = os.path.join(self.game_dir, "img", name)
-        try:
-            image = pygame.image.load(image_path).convert_alpha()
-            if scale != 1:
-                size = (int(image.get_width() * scale), int(image.get_height() * scale))
-                image = pygame.transform.scale(image, size)
-            return image
-        except pygame.error as e:
-            print(f"Error loading image {name}: {e}")
-            # Return a placeholder surface if image fails to load
-            surf = pygame.Surface((50, 50), pygame.SRCALPHA)
-            surf.fill((255, 0, 255))  # Magenta placeholder
-            return surf
+        # Load images: every scaled/flipped version is made once, up front,
+        # at the render size, and kept for the whole program (see game_utils/atlas.py)
+        self.atlas = get_atlas("DTS", self.build_atlas, render_scale=self.viewport.scale)
+        self.enemy_img = self.atlas.image("zombie")
     
-    def load_background(self):
-        """Load and return the background image"""
-        bg_img = pygame.image.load(os.path.join(self.game_dir, "img", "background.png"))
-        return pygame.transform.scale(bg_img, (SCREEN_WIDTH, SCREEN_HEIGHT))
+    def build_atlas(self, atlas):
+        """All the pictures the game draws, ready to blit"""
+        img_dir = os.path.join(self.game_dir, "img")
+        atlas.add("zombie", os.path.join(img_dir, "zomB.png"), scale=0.5)
+        atlas.add("player", os.path.join(img_dir, "avatar.png"), scale=0.5)
+        atlas.add("player_flipped", os.path.join(img_dir, "avatar.png"), scale=0.5, flip_x=True)
+        atlas.add("background", os.path.join(img_dir, "background.png"),
+                  size=(SCREEN_WIDTH, SCREEN_HEIGHT), alpha=False)
     
     def create_player(self):
         """Create and return the player character"""
-        return Player(200, 200, 0.5, 15, self.player_img)
+        return Player(200, 200, 0.5, 15, self.atlas)
     
     def create_enemy(self, x, y):
         """Create and return an enemy at the specified position"""
         speed = random.randint(3, 7) * 5  # Make enemies faster
-        return Enemy(x, y, 0.5, speed, self.enemy_img)
+        return Enemy(x, y, 0.5, speed, self.atlas)
     
     def create_level(self, level):
         """Create a level with enemies based on the level number"""
@@ -108,7 +169,21 @@ class DTSGame:
         
         # Create enemies based on level
         num_enemies = 5 if level == 1 else (level * 3) + 2
-        for _ in range(num_enemies):
+        self.spawn_enemies(num_enemies * self.spawn_batch)
+    
+    def spawn_enemies(self, count):
+        """Add enemies just off-screen to the right"""
+        if self.horde_mode:
+            # All at once: arrays of positions and speeds (same ranges as below)
+            count = min(count, self.max_enemies - len(self.enemies))
+            if count <= 0:
+                return
+            rng = np.random.default_rng(random.getrandbits(64))
+            self.enemies.spawn(SCREEN_WIDTH + rng.integers(50, 301, count),
+                               rng.integers(0, SCREEN_HEIGHT + 1, count),
+                               rng.integers(3, 8, count) * 5)
+            return
+        for _ in range(count):
             x = SCREEN_WIDTH + random.randint(50, 300)  # Spawn off-screen to the right
             y = random.randint(0, SCREEN_HEIGHT)
             enemy = self.create_enemy(x, y)
@@ -118,6 +193,7 @@ class DTSGame:
     def handle_events(self):
         """Handle all game events"""
         for event in pygame.event.get():
+            self.profiler.handle_event(event)
             if event.type == pygame.QUIT:
                 self.running = False
             
@@ -133,6 +209,8 @@ class DTSGame:
                     self.moving_down = True
                 elif event.key == pygame.K_ESCAPE:
                     self.running = False
+                elif event.key == pygame.K_SPACE and self.state == GAME_OVER:
+                    self.reset()  # Play again!
             
             # Handle keyup events
             elif event.type == pygame.KEYUP:
@@ -147,6 +225,15 @@ class DTSGame:
     
     def update(self):
         """Update game state"""
+        if self.state == DYING:
+            # Enemies keep walking while the death sound plays
+            self.enemies.update()
+            if pygame.time.get_ticks() - self.state_started >= self.dying_time:
+                self.set_state(GAME_OVER)
+            return
+        if self.state == GAME_OVER:
+            return
+        
         # Update player
         self.player.move(self.moving_left, self.moving_right, 
                         self.moving_up, self.moving_down)
@@ -155,12 +242,18 @@ class DTSGame:
         self.enemies.update()
         
         # Check for collisions
-        if pygame.sprite.spritecollide(self.player, self.enemies, True):
-            self.hit_sound.set_volume(0.5)
+        if self.horde_mode:
+            hit = self.enemies.collide(self.player.rect)
+        else:
+            # Only enemies in the grid cells near the player get checked
+            hit = self.enemies.collide(self.player.rect, dokill=True)
+        if hit:
+            # play() doesn't wait - the sound plays while the game keeps drawing
             self.hit_sound.play()
-            # Wait for the sound to finish playing before ending the game
-            pygame.time.delay(int(self.hit_sound.get_length() * 1000))
-            self.running = False
+            # The dying state lasts as long as the death sound
+            self.dying_time = int(self.hit_sound.get_length(DYING_TIME / 1000) * 1000)
+            self.set_state(DYING)
+            return
         
         # Check if level is complete (all enemies cleared)
         if len(self.enemies) == 0:
@@ -171,66 +264,90 @@ class DTSGame:
         
         # Spawn new enemies occasionally
         self.spawn_counter += 1
-        if self.spawn_counter >= self.spawn_rate and len(self.enemies) < 10:  # Limit max enemies
+        if self.spawn_counter >= self.spawn_rate and len(self.enemies) < self.max_enemies:  # Limit max enemies
             self.spawn_counter = 0
-            x = SCREEN_WIDTH + random.randint(50, 300)  # Spawn off-screen to the right
-            y = random.randint(0, SCREEN_HEIGHT)
-            enemy = self.create_enemy(x, y)
-            self.enemies.add(enemy)
-            self.all_sprites.add(enemy)
+            self.spawn_enemies(min(self.spawn_batch, self.max_enemies - len(self.enemies)))
         
         # Score is now only increased by completing levels
     
     def draw(self):
         """Draw everything to the screen"""
         # Draw background
-        self.screen.blit(self.background, (0, 0))
+        self.atlas.blit(self.screen, "background", (0, 0))
         
-        # Draw all sprites
+        # Draw all sprites (their rects are logical, the viewport turns them into pixels)
         for entity in self.all_sprites:
             if hasattr(entity, 'draw'):
-                entity.draw(self.screen)
+                entity.draw(self.screen, self.viewport)
             else:
-                self.screen.blit(entity.image, entity.rect)
+                self.screen.blit(entity.image, self.viewport.point(entity.rect.topleft))
+        if self.horde_mode:
+            self.enemies.draw(self.screen)
         
         # Draw UI elements
         self.draw_ui()
+        self.profiler.draw_overlay(self.screen)
         
-        # Update the display
-        pygame.display.flip()
+        # Update the display (one scale step if the window size differs)
+        self.viewport.present()
+    
+    def render_ui_text(self, text, color):
+        """Rendered UI text (cached, so unchanged text isn't re-rendered)"""
+        return render_text(text, self.viewport.length(FONT_SIZE), color, name=FONT_NAME, sysfont=True)
     
     def draw_ui(self):
-        """Draw user interface elements"""
+        """Draw user interface elements (positions are logical)"""
+        point = self.viewport.point
+        
         # Draw score
-        score_text = self.font.render(f'Score: {self.score}', True, (255, 255, 255))
-        self.screen.blit(score_text, (10, 10))
+        score_text = self.render_ui_text(f'Score: {self.score}', (255, 255, 255))
+        self.screen.blit(score_text, point((10, 10)))
         
         # Draw level
-        level_text = self.font.render(f'Level: {self.level}', True, (255, 255, 255))
-        self.screen.blit(level_text, (10, 60))
+        level_text = self.render_ui_text(f'Level: {self.level}', (255, 255, 255))
+        self.screen.blit(level_text, point((10, 60)))
         
         # Draw controls hint
-        controls_text = self.font.render('WASD to move', True, (200, 200, 200))
-        self.screen.blit(controls_text, (10, SCREEN_HEIGHT - 40))
-    
-    def run(self):
-        """Main game loop"""
-        while self.running:
-            self.clock.tick(FPS)
-            self.handle_events()
-            self.update()
-            self.draw()
+        controls_text = self.render_ui_text('WASD to move', (200, 200, 200))
+        self.screen.blit(controls_text, point((10, SCREEN_HEIGHT - 40)))
         
-        # Clean up
+        if self.state == GAME_OVER:
+            self.layers.blit(self.screen, "shade")
+            game_over_text = self.render_ui_text('GAME OVER', (255, 0, 0))
+            self.screen.blit(game_over_text, game_over_text.get_rect(
+                center=point((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))))
+            restart_text = self.render_ui_text('Press SPACE to play again (ESC to quit)', (255, 255, 255))
+            self.screen.blit(restart_text, restart_text.get_rect(
+                center=point((SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 70))))
+    
+    def step(self):
+        """Run one frame; returns False once the game should stop"""
+        with self.profiler.frame():
+            with self.profiler.phase("events"):
+                self.handle_events()
+            if self.running:
+                with self.profiler.phase("update"):
+                    self.update()
+                with self.profiler.phase("draw"):
+                    self.draw()
+        return self.running
+    
+    def quit(self):
+        """Clean up"""
         pygame.quit()
         sys.exit()
+    
+    def run(self):
+        """Main game loop (cooperative in the browser, see game_utils.frame_loop)"""
+        run_game(self.step, FPS, self.clock, on_exit=self.quit)
 
 
 class Player(pygame.sprite.Sprite):
-    def __init__(self, x, y, scale, speed, image):
+    def __init__(self, x, y, scale, speed, atlas):
         super().__init__()
-        self.image = image
-        self.rect = self.image.get_rect()
+        self.atlas = atlas
+        self.image = atlas.image("player")
+        self.rect = atlas.get_rect("player")  # Logical size, not pixels
         self.rect.center = (x, y)
         self.rect = self.rect.inflate(-20, -20)
         self.speed = speed
@@ -260,23 +377,22 @@ class Player(pygame.sprite.Sprite):
         self.rect.x = max(0, min(self.rect.x, SCREEN_WIDTH - self.rect.width))
         self.rect.y = max(0, min(self.rect.y, SCREEN_HEIGHT - self.rect.height))
     
-    def draw(self, surface):
+    def draw(self, surface, viewport):
         """Draw the player on the given surface"""
-        # Flip the image if moving left
-        if self.flip:
-            surface.blit(pygame.transform.flip(self.image, True, False), self.rect)
-        else:
-            surface.blit(self.image, self.rect)
+        # Use the pre-flipped image if moving left
+        self.atlas.blit(surface, "player_flipped" if self.flip else "player",
+                        viewport.point(self.rect.topleft))
         
         # Draw hitbox
-        pygame.draw.rect(surface, (255, 0, 0), self.rect, 2)
+        pygame.draw.rect(surface, (255, 0, 0), viewport.rect(self.rect), viewport.length(2))
 
 
 class Enemy(pygame.sprite.Sprite):
-    def __init__(self, x, y, scale, speed, image):
+    def __init__(self, x, y, scale, speed, atlas):
         super().__init__()
-        self.image = image
-        self.rect = self.image.get_rect()
+        self.atlas = atlas
+        self.image = atlas.image("zombie")
+        self.rect = atlas.get_rect("zombie")  # Logical size, not pixels
         self.rect.center = (x, y)
         self.rect = self.rect.inflate(-20, -20)
         self.speed = speed
@@ -289,11 +405,11 @@ class Enemy(pygame.sprite.Sprite):
         if self.rect.right < 0:
             self.kill()  # This removes the sprite from all groups
     
-    def draw(self, surface):
+    def draw(self, surface, viewport):
         """Draw the enemy on the given surface"""
-        surface.blit(self.image, self.rect)
+        self.atlas.blit(surface, "zombie", viewport.point(self.rect.topleft))
         # Draw hitbox
-        pygame.draw.rect(surface, (255, 0, 0), self.rect, 2)
+        pygame.draw.rect(surface, (255, 0, 0), viewport.rect(self.rect), viewport.length(2))
 
 
 # Start the game
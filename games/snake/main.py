@@ -5,7 +5,7 @@ This is a simple Snake game to help you learn:
 - Game loops (how games run continuously)
 - User input (keyboard controls)
 - Collision detection (when things bump into each other)
-- Lists and coordinates (tracking the snake's body)
+- Queues, sets and coordinates (tracking the snake's body)
 
 READ TIME: 15-20 minutes
 DIFFICULTY: Easy 🟢
@@ -16,6 +16,19 @@ Let's learn by coding a classic game!
 import pygame
 import random
 import sys
+import os
+
+# Let this game find the shared helpers in game_utils/ (two folders up)
+PROJECT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
+
+from game_utils.frame_loop import run_game
+from game_utils.layers import LayerCache, shade
+from game_utils.profiling import FrameProfiler
+from game_utils.text import render_text
+
+from snake_core import DOWN, LEFT, RIGHT, UP, SnakeCore, cell_index, cell_xy
 
 # ============================================================================
 # CONSTANTS (Settings that never change)
@@ -40,6 +53,15 @@ DARK_GREEN = (0, 200, 0)
 # Game speed
 FPS = 10  # Frames per second (higher = faster)
 
+# The top-left corner where the score is shown (measured in whole grid
+# cells, so we know exactly which cells sit underneath the text)
+SCORE_AREA = pygame.Rect(0, 0, 10 * GRID_SIZE, 2 * GRID_SIZE)
+
+
+# The rules (moving, eating, growing, crashing) live in snake_core.py,
+# which doesn't need pygame at all - this file draws them and reads keys.
+# Board cells are numbered: cell_index(x, y) and cell_xy(cell) convert.
+
 
 # ============================================================================
 # GAME CLASS (The Brain of Our Game)
@@ -47,7 +69,7 @@ FPS = 10  # Frames per second (higher = faster)
 
 class SnakeGame:
     """
-    This class holds all the game logic!
+    This class runs the game: it reads keys and draws the snake!
     
     WHAT'S A CLASS?
     A class is like a blueprint for creating objects.
@@ -55,6 +77,14 @@ class SnakeGame:
     and we can make many cookies from it!
     """
     
+    # Which direction each arrow key turns the snake
+    KEY_DIRECTIONS = {
+        pygame.K_UP: UP,
+        pygame.K_DOWN: DOWN,
+        pygame.K_LEFT: LEFT,
+        pygame.K_RIGHT: RIGHT,
+    }
+    
     def __init__(self):
         """
         The __init__ method runs when we create a new game.
@@ -73,42 +103,59 @@ class SnakeGame:
         # Create a clock to control game speed
         self.clock = pygame.time.Clock()
         
-        # Snake starting position (middle of screen)
-        # The snake is a LIST of positions!
-        # Each position is a list [x, y]
-        start_x = GRID_WIDTH // 2
-        start_y = GRID_HEIGHT // 2
-        
-        self.snake = [[start_x, start_y]]  # List with one segment
-        
-        # Snake direction (starts moving right)
-        self.direction = [1, 0]  # [1, 0] means right, [0, 1] means down
+        # Optional timing tools (turn on with ARCADE_PROFILE=1, F3 = overlay)
+        self.profiler = FrameProfiler("snake", FPS)
         
-        # Create the first food
-        self.food = self.create_food()
+        # The half-transparent game-over shade is made once and reused
+        self.layers = LayerCache()
+        self.layers.add("shade", lambda: shade((WINDOW_WIDTH, WINDOW_HEIGHT), BLACK, 128))
         
-        # Score starts at 0
-        self.score = 0
+        # The rules of the game (see snake_core.py)
+        # rng=random: food spots come from Python's random module
+        self.core = SnakeCore(GRID_WIDTH, GRID_HEIGHT, rng=random)
         
-        # Game state
-        self.game_over = False
+        # Drawing bookkeeping: which cells changed since the last frame?
+        # (see draw() - we only repaint what changed!)
+        self.dirty_cells = []
+        self.needs_full_redraw = True
+        self.drawn_score = None
+        self.drawn_game_over = False
     
-    def create_food(self):  
-        """
-        Creates food at a random position!
+    # The game's state, read from the core
+    
+    @property
+    def snake(self):
+        """A DEQUE of cell numbers, head first"""
+        return self.core.snake
+    
+    @property
+    def occupied(self):
+        """A SET of the cells the snake covers"""
+        return self.core.occupied
+    
+    @property
+    def food(self):
+        """The food's cell (None once the board is full)"""
+        return self.core.food
+    
+    @property
+    def score(self):
+        return self.core.score
+    
+    @property
+    def game_over(self):
+        return self.core.game_over
+    
+    @property
+    def won(self):
+        return self.core.won
+    
+    def restart(self):
+        """Start a new game (the window and everything else stays)"""
         
-        RANDOM NUMBERS:
-        random.randint(a, b) gives a random number between a and b
-        This makes the food appear in different places!
-        """
-        while True:
-            # Pick random x and y coordinates
-            x = random.randint(0, GRID_WIDTH - 1)
-            y = random.randint(0, GRID_HEIGHT - 1)
-            
-            # Make sure food doesn't appear on the snake!
-            if [x, y] not in self.snake:
-                return [x, y]
+        self.core.reset()
+        self.dirty_cells.clear()
+        self.needs_full_redraw = True
     
     def handle_input(self):
         """
@@ -119,33 +166,29 @@ class SnakeGame:
         (key presses, mouse clicks, etc.)
         """
         for event in pygame.event.get():
+            self.profiler.handle_event(event)
             
             # Did the player close the window?
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             
+            # Was the window covered up and shown again? Repaint it all.
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.needs_full_redraw = True
+            
             # Did the player press a key?
             if event.type == pygame.KEYDOWN:
                 
                 # Arrow key controls!
-                # We check that they're not trying to go backwards
-                
-                if event.key == pygame.K_UP and self.direction != [0, 1]:
-                    self.direction = [0, -1]  # Up
+                # (the core makes sure they're not trying to go backwards)
                 
-                elif event.key == pygame.K_DOWN and self.direction != [0, -1]:
-                    self.direction = [0, 1]   # Down
-                
-                elif event.key == pygame.K_LEFT and self.direction != [1, 0]:
-                    self.direction = [-1, 0]  # Left
-                
-                elif event.key == pygame.K_RIGHT and self.direction != [-1, 0]:
-                    self.direction = [1, 0]   # Right
+                if event.key in self.KEY_DIRECTIONS:
+                    self.core.turn(self.KEY_DIRECTIONS[event.key])
                 
                 # Press SPACE to restart after game over
                 elif event.key == pygame.K_SPACE and self.game_over:
-                    self.__init__()  # Restart the game!
+                    self.restart()  # Restart the game!
     
     def update(self):
         """
@@ -155,43 +198,72 @@ class SnakeGame:
         Games run in a loop - update position, check collisions, repeat!
         """
         
-        if self.game_over:
-            return  # Don't update if game is over
-        
-        # Calculate new head position
-        # The head is the first item in the snake list
-        old_head = self.snake[0]
-        new_head = [
-            old_head[0] + self.direction[0],
-            old_head[1] + self.direction[1]
-        ]
-        
-        # Check if snake hit the wall
-        if (new_head[0] < 0 or new_head[0] >= GRID_WIDTH or
-            new_head[1] < 0 or new_head[1] >= GRID_HEIGHT):
-            self.game_over = True
+        # Move the snake one cell and remember which cells changed
+        self.dirty_cells.extend(self.core.tick())
+    
+    def draw(self):
+        """
+        Shows the newest frame on the screen!
+        
+        DIRTY RECTANGLES:
+        Each tick only a few cells change: the new head, the old tail and
+        maybe the food. So instead of repainting all 900 cells, we repaint
+        just those "dirty" cells and tell pygame to update only those
+        rectangles. That's the same (tiny) amount of work for a snake of
+        length 3 or length 800!
+        """
+        
+        if self.needs_full_redraw or self.profiler.overlay_visible:
+            self.draw_everything()
             return
         
-        # Check if snake hit itself
-        if new_head in self.snake:
-            self.game_over = True
+        if self.game_over:
+            # The game-over screen doesn't change - draw it just once
+            if not self.drawn_game_over:
+                self.draw_everything()
             return
         
-        # Add new head to snake
-        # insert(0, item) adds item at the beginning of the list
-        self.snake.insert(0, new_head)
-        
-        # Did the snake eat the food?
-        if new_head == self.food:
-            # Yay! Grow the snake and make new food!
-            self.score += 1
-            self.food = self.create_food()
-        else:
-            # Remove the tail (snake doesn't grow)
-            # pop() removes the last item from a list
-            self.snake.pop()
+        changed = [self.draw_cell(cell) for cell in self.dirty_cells]
+        self.dirty_cells.clear()
+        
+        # Repaint the score if it changed or a cell under it was repainted
+        if self.score != self.drawn_score or SCORE_AREA.collidelist(changed) != -1:
+            changed.append(self.draw_score_area())
+        
+        if changed:
+            pygame.display.update(changed)  # Only these rectangles!
     
-    def draw(self):
+    def draw_cell(self, cell):
+        """Repaint one grid cell (empty, snake or food) and return its rectangle"""
+        
+        grid_x, grid_y = cell_xy(cell)
+        rect = pygame.Rect(grid_x * GRID_SIZE, grid_y * GRID_SIZE, GRID_SIZE, GRID_SIZE)
+        
+        self.screen.fill(BLACK, rect)
+        if cell in self.occupied:
+            pygame.draw.rect(self.screen, GREEN, rect)
+            pygame.draw.rect(self.screen, DARK_GREEN, rect, 2)
+        elif cell == self.food:
+            pygame.draw.rect(self.screen, RED, rect)
+        return rect
+    
+    def draw_score_area(self):
+        """Repaint the cells under the score, then the score on top"""
+        
+        for grid_y in range(SCORE_AREA.height // GRID_SIZE):
+            for grid_x in range(SCORE_AREA.width // GRID_SIZE):
+                self.draw_cell(cell_index(grid_x, grid_y))
+        self.draw_score()
+        return SCORE_AREA
+    
+    def draw_score(self):
+        # render_text() remembers fonts and text it already drew,
+        # so we don't rebuild the same picture of "Score: 5" every frame
+        score_text = render_text(f'Score: {self.score}', 36, WHITE)
+        self.screen.blit(score_text, (10, 10))  # blit means "draw text"
+        self.drawn_score = self.score
+    
+    def draw_everything(self):
         """
         Draws everything on the screen!
         
@@ -205,8 +277,9 @@ class SnakeGame:
         # Draw the snake
         for segment in self.snake:
             # Convert grid position to pixel position
-            x = segment[0] * GRID_SIZE
-            y = segment[1] * GRID_SIZE
+            grid_x, grid_y = cell_xy(segment)
+            x = grid_x * GRID_SIZE
+            y = grid_y * GRID_SIZE
             
             # Draw the segment
             # pygame.draw.rect(surface, color, [x, y, width, height])
@@ -215,39 +288,56 @@ class SnakeGame:
             # Draw a border to make it look nicer
             pygame.draw.rect(self.screen, DARK_GREEN, [x, y, GRID_SIZE, GRID_SIZE], 2)
         
-        # Draw the food
-        food_x = self.food[0] * GRID_SIZE
-        food_y = self.food[1] * GRID_SIZE
-        pygame.draw.rect(self.screen, RED, [food_x, food_y, GRID_SIZE, GRID_SIZE])
+        # Draw the food (there is none once the board is full!)
+        if self.food is not None:
+            food_grid_x, food_grid_y = cell_xy(self.food)
+            food_x = food_grid_x * GRID_SIZE
+            food_y = food_grid_y * GRID_SIZE
+            pygame.draw.rect(self.screen, RED, [food_x, food_y, GRID_SIZE, GRID_SIZE])
         
         # Draw the score
-        font = pygame.font.Font(None, 36)  # Create a font
-        score_text = font.render(f'Score: {self.score}', True, WHITE)
-        self.screen.blit(score_text, (10, 10))  # blit means "draw text"
+        self.draw_score()
         
         # Draw game over message
         if self.game_over:
-            # Create semi-transparent overlay
-            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-            overlay.set_alpha(128)  # 128 = half transparent
-            overlay.fill(BLACK)
-            self.screen.blit(overlay, (0, 0))
+            # Semi-transparent overlay (128 = half transparent)
+            self.layers.blit(self.screen, "shade")
             
-            # Game over text
-            big_font = pygame.font.Font(None, 72)
-            game_over_text = big_font.render('GAME OVER', True, RED)
+            # Game over text (or a victory message!)
+            if self.won:
+                game_over_text = render_text('YOU WIN!', 72, GREEN)
+            else:
+                game_over_text = render_text('GAME OVER', 72, RED)
             text_rect = game_over_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2))
             self.screen.blit(game_over_text, text_rect)
             
             # Restart instruction
-            small_font = pygame.font.Font(None, 36)
-            restart_text = small_font.render('Press SPACE to restart', True, WHITE)
+            restart_text = render_text('Press SPACE to restart', 36, WHITE)
             restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 60))
             self.screen.blit(restart_text, restart_rect)
         
+        # Performance overlay (only when profiling is turned on)
+        self.profiler.draw_overlay(self.screen)
+        
+        # Everything is up to date now
+        self.dirty_cells.clear()
+        self.needs_full_redraw = False
+        self.drawn_game_over = self.game_over
+        
         # Update the display
         pygame.display.flip()  # flip() shows everything we drew
     
+    def step(self):
+        """One frame of the game: input, update, draw"""
+        
+        with self.profiler.frame():
+            with self.profiler.phase("input"):
+                self.handle_input()    # 1. Check for player input
+            with self.profiler.phase("update"):
+                self.update()          # 2. Update game state
+            with self.profiler.phase("draw"):
+                self.draw()            # 3. Draw everything
+    
     def run(self):
         """
         The main game loop!
@@ -257,13 +347,12 @@ class SnakeGame:
         2. Update (move things, check collisions)
         3. Draw (show everything on screen)
         4. Repeat!
+        
+        run_game() calls step() FPS times per second (4. Wait to maintain FPS).
+        In a web browser it takes turns with the page, so the tab never freezes!
         """
         
-        while True:
-            self.handle_input()    # 1. Check for player input
-            self.update()          # 2. Update game state
-            self.draw()            # 3. Draw everything
-            self.clock.tick(FPS)   # 4. Wait to maintain FPS
+        run_game(self.step, FPS, self.clock, on_exit=pygame.quit)
 
 
 # ============================================================================
@@ -284,7 +373,7 @@ if __name__ == "__main__":
 #
 # PROGRAMMING CONCEPTS:
 # ✅ Classes and objects (organizing code)
-# ✅ Lists (storing multiple items)
+# ✅ Deques and sets (storing items so they're fast to use)
 # ✅ Game loops (the heart of every game)
 # ✅ Event handling (responding to input)
 # ✅ Collision detection (checking if things touch)
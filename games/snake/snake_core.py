@@ -0,0 +1,247 @@
+"""
+🧠 Snake without a window - just the rules!
+
+SnakeCore knows nothing about pygame, the screen or the clock. Each
+tick() moves the snake one cell, and turn() changes where it's heading:
+
+    core = SnakeCore(seed=7)     # same seed = same food spots, every time
+    core.turn(UP)
+    changed = core.tick()        # the cells that changed (for drawing)
+
+The pygame game in main.py draws it and feeds it key presses, and
+batch_runner.py plays thousands of games with it, no window needed.
+"""
+import random
+from collections import deque
+
+# Board size (in cells)
+GRID_WIDTH = 30
+GRID_HEIGHT = 30
+
+# Directions as (dx, dy) - y grows DOWN the screen
+UP = (0, -1)
+DOWN = (0, 1)
+LEFT = (-1, 0)
+RIGHT = (1, 0)
+DIRECTIONS = (UP, DOWN, LEFT, RIGHT)
+
+
+# ============================================================================
+# GRID CELLS (Turning (x, y) into one number)
+# ============================================================================
+# Every square on the board gets ONE number, counting left to right,
+# top to bottom. On a 30-wide grid: (0, 0) -> 0, (1, 0) -> 1, (0, 1) -> 30
+# Numbers are quicker to compare and store than [x, y] lists!
+
+def cell_index(x, y, width=GRID_WIDTH):
+    """Turn grid coordinates into a cell number"""
+    return y * width + x
+
+
+def cell_xy(index, width=GRID_WIDTH):
+    """Turn a cell number back into (x, y) grid coordinates"""
+    return index % width, index // width
+
+
+class FreeCells:
+    """
+    All the cells the snake is NOT on, kept ready for picking food spots.
+
+    DATA STRUCTURE TRICK (swap-remove):
+    The cells live in a plain list, and a dictionary remembers where each
+    cell sits in that list. To remove a cell we move the LAST cell into
+    its spot and shrink the list by one - no shifting everything over!
+    Adding, removing and picking a random cell all take the same tiny
+    amount of time, even when the board is 99% full.
+    """
+
+    def __init__(self, cells, rng=random):
+        self.cells = list(cells)
+        self.position = {cell: i for i, cell in enumerate(self.cells)}
+        self.rng = rng
+
+    def __len__(self):
+        return len(self.cells)
+
+    def add(self, cell):
+        self.position[cell] = len(self.cells)
+        self.cells.append(cell)
+
+    def remove(self, cell):
+        i = self.position.pop(cell)
+        last = self.cells.pop()
+        if last != cell:
+            # Move the last cell into the hole we just made
+            self.cells[i] = last
+            self.position[last] = i
+
+    def random_cell(self):
+        return self.rng.choice(self.cells)
+
+
+class SnakeCore:
+    """The rules of Snake, one tick at a time"""
+
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT, seed=None, rng=None):
+        """
+        seed    makes the food spots repeatable (ignored if rng is given)
+        rng     anything with choice(), e.g. the random module itself
+        """
+        self.width = width
+        self.height = height
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.reset()
+
+    def reset(self, seed=None):
+        """Start a new game (reseeding the food if a seed is given)"""
+        if seed is not None:
+            self.rng.seed(seed)
+
+        # Snake starting position (middle of the board)
+        # The snake is a DEQUE ("deck") of cell numbers, head first!
+        # A deque can add or remove at BOTH ends instantly, which is
+        # exactly what a moving snake does (new head, old tail).
+        start = self.cell(self.width // 2, self.height // 2)
+        self.snake = deque([start])  # One segment
+
+        # A SET of the cells the snake covers. Asking "is this cell in the
+        # set?" takes the same time for a snake of 1 or 900 segments!
+        self.occupied = {start}
+
+        # Every other cell is free (that's where food can go)
+        self.free_cells = FreeCells(
+            (cell for cell in range(self.width * self.height) if cell != start), self.rng
+        )
+
+        self.direction = RIGHT  # Starts moving right
+        self.food = self.create_food()
+        self.score = 0
+        self.ticks = 0
+        self.game_over = False
+        self.won = False  # True if the snake fills the WHOLE board!
+
+    def cell(self, x, y):
+        return y * self.width + x
+
+    def create_food(self):
+        """
+        A random free cell for the food, or None if there are none left.
+
+        We only pick from the FREE cells, so food never lands on the
+        snake and we never have to "try again".
+        """
+        if len(self.free_cells) == 0:
+            return None
+        return self.free_cells.random_cell()
+
+    def turn(self, direction):
+        """Head in a new direction - but never straight back! Returns True if it turned."""
+        if direction[0] == -self.direction[0] and direction[1] == -self.direction[1]:
+            return False
+        self.direction = direction
+        return True
+
+    def tick(self):
+        """
+        Move the snake one cell. Returns the cells that changed
+        (new head, old tail, new food) so a screen can redraw just those.
+        """
+        if self.game_over:
+            return ()
+        self.ticks += 1
+
+        # Calculate new head position
+        head_x, head_y = self.snake[0] % self.width, self.snake[0] // self.width
+        new_x = head_x + self.direction[0]
+        new_y = head_y + self.direction[1]
+
+        # Did the snake hit the wall?
+        if new_x < 0 or new_x >= self.width or new_y < 0 or new_y >= self.height:
+            self.game_over = True
+            return ()
+
+        # Did the snake hit itself? (one quick set lookup!)
+        new_head = new_y * self.width + new_x
+        if new_head in self.occupied:
+            self.game_over = True
+            return ()
+
+        # Add the new head at the front
+        self.snake.appendleft(new_head)
+        self.occupied.add(new_head)
+        self.free_cells.remove(new_head)
+
+        # Did the snake eat the food?
+        if new_head == self.food:
+            # Yay! Grow the snake and make new food!
+            self.score += 1
+            self.food = self.create_food()
+
+            # No room left for food? The snake filled the board - you win!
+            if self.food is None:
+                self.won = True
+                self.game_over = True
+                return (new_head,)
+            return (new_head, self.food)
+
+        # Remove the tail (the snake doesn't grow)
+        tail = self.snake.pop()
+        self.occupied.discard(tail)
+        self.free_cells.add(tail)
+        return (new_head, tail)
+
+
+# ============================================================================
+# HEADLESS EPISODES (used by batch_runner.py)
+# ============================================================================
+
+def random_policy(core, rng):
+    """Keep going, but turn a random way now and then"""
+    if rng.random() < 0.2:
+        return rng.choice(DIRECTIONS)
+    return None
+
+
+def greedy_policy(core, rng):
+    """Head for the food, without crashing on the very next move"""
+    head_x, head_y = cell_xy(core.snake[0], core.width)
+    food_x, food_y = cell_xy(core.food, core.width) if core.food is not None else (head_x, head_y)
+    best = None
+    for dx, dy in DIRECTIONS:
+        if (dx, dy) == (-core.direction[0], -core.direction[1]):
+            continue  # Can't turn straight back
+        x, y = head_x + dx, head_y + dy
+        if not (0 <= x < core.width and 0 <= y < core.height):
+            continue
+        if core.cell(x, y) in core.occupied:
+            continue
+        distance = abs(food_x - x) + abs(food_y - y)
+        if best is None or distance < best[0]:
+            best = (distance, (dx, dy))
+    return best[1] if best else None
+
+
+POLICIES = {"random": random_policy, "greedy": greedy_policy}
+
+
+def run_episode(seed, policy="random", max_frames=10_000):
+    """
+    Play one whole game without a window. Returns its results:
+    score, length (of the snake), frames (ticks played) and whether
+    the game actually ended (False if it ran out of frames).
+    """
+    core = SnakeCore(seed=seed)
+    choose = POLICIES[policy]
+    rng = random.Random(seed ^ 0x5EED)  # The policy's own dice
+    while not core.game_over and core.ticks < max_frames:
+        direction = choose(core, rng)
+        if direction is not None:
+            core.turn(direction)
+        core.tick()
+    return {
+        "score": core.score,
+        "lines_cleared": None,
+        "length": len(core.snake),
+        "frames": core.ticks,
+        "finished": core.game_over,
+    }
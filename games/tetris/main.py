@@ -16,6 +16,19 @@ A more advanced example - lots to learn!
 import pygame
 import random
 import sys
+import os
+
+# Let this game find the shared helpers in game_utils/ (two folders up)
+PROJECT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
+if PROJECT_DIR not in sys.path:
+    sys.path.insert(0, PROJECT_DIR)
+
+from game_utils.frame_loop import run_game
+from game_utils.layers import LayerCache, grid_lines, shade
+from game_utils.profiling import FrameProfiler
+from game_utils.text import render_text
+
+from tetris_core import DOWN, LEFT, RIGHT, ROTATE, TetrisCore
 
 # ============================================================================
 # CONSTANTS
@@ -46,86 +59,17 @@ COLORS = [
     (255, 165, 0),    # Orange - L piece
 ]
 
-# Tetromino shapes
-# These are 2D ARRAYS (lists of lists)!
-# 1 = filled block, 0 = empty space
-SHAPES = [
-    # I piece
-    [[1, 1, 1, 1]],
-    
-    # O piece
-    [[1, 1],
-     [1, 1]],
-    
-    # T piece
-    [[0, 1, 0],
-     [1, 1, 1]],
-    
-    # S piece
-    [[0, 1, 1],
-     [1, 1, 0]],
-    
-    # Z piece
-    [[1, 1, 0],
-     [0, 1, 1]],
-    
-    # J piece
-    [[1, 0, 0],
-     [1, 1, 1]],
-    
-    # L piece
-    [[0, 0, 1],
-     [1, 1, 1]],
-]
+# Tetromino shapes (and all their rotations) live in tetris_pieces.py
 
 FPS = 60
 FALL_SPEED = 500  # Milliseconds between drops
 
+# Try nudging a piece sideways/up when it can't turn where it is?
+WALL_KICKS = False
 
-# ============================================================================
-# TETROMINO CLASS
-# ============================================================================
-
-class Tetromino:
-    """
-    Represents a falling Tetris piece!
-    
-    DATA STRUCTURES:
-    - self.shape is a 2D array (list of lists)
-    - Each number in the array is either 0 or 1
-    """
-    
-    def __init__(self):
-        """Create a random tetromino at the top of the screen"""
-        
-        # Pick a random shape
-        shape_index = random.randint(0, len(SHAPES) - 1)
-        self.shape = SHAPES[shape_index]
-        self.color = COLORS[shape_index]
-        
-        # Starting position (top-middle of grid)
-        self.x = GRID_WIDTH // 2 - len(self.shape[0]) // 2
-        self.y = 0
-    
-    def rotate(self):
-        """
-        Rotate the piece 90 degrees clockwise!
-        
-        ROTATION ALGORITHM:
-        To rotate a 2D array, we:
-        1. Transpose it (swap rows and columns)
-        2. Reverse each row
-        
-        Example: [[1, 0],    becomes    [[0, 1],
-                  [1, 1]]                 [1, 1]]
-        """
-        # Transpose: convert rows to columns
-        rotated = list(zip(*self.shape))
-        
-        # Reverse each row
-        rotated = [list(row[::-1]) for row in rotated]
-        
-        return rotated
+# How the board is stored: "bits" (rows as bitmasks - fast) or "list"
+# (the simple cell-by-cell version). See tetris_board.py!
+BOARD_ENGINE = os.environ.get("ARCADE_TETRIS_BOARD", "bits")
 
 
 # ============================================================================
@@ -133,7 +77,22 @@ class Tetromino:
 # ============================================================================
 
 class TetrisGame:
-    """The main game logic!"""
+    """
+    The Tetris you can see and play!
+    
+    The RULES (pieces, moving, locking, clearing lines, scoring) live in
+    tetris_core.py, which doesn't know about pygame at all. This class
+    just turns key presses into actions, makes the piece fall every
+    FALL_SPEED milliseconds, and draws the result.
+    """
+    
+    # Which action each key does
+    KEY_ACTIONS = {
+        pygame.K_LEFT: LEFT,     # Move left
+        pygame.K_RIGHT: RIGHT,   # Move right
+        pygame.K_DOWN: DOWN,     # Move down faster (bonus point!)
+        pygame.K_UP: ROTATE,     # Rotate
+    }
     
     def __init__(self):
         """Initialize the game"""
@@ -146,149 +105,70 @@ class TetrisGame:
         
         self.clock = pygame.time.Clock()
         
-        # Create the game grid
-        # 2D ARRAY: A list of lists representing the board
-        # 0 = empty, a color tuple = filled with that color
-        self.grid = [[0 for _ in range(GRID_WIDTH)] for _ in range(GRID_HEIGHT)]
+        # Optional timing tools (turn on with ARCADE_PROFILE=1, F3 = overlay)
+        self.profiler = FrameProfiler("tetris", FPS)
+        
+        # Things that look the same every frame are drawn once, then reused
+        self.layers = LayerCache()
+        self.layers.add("grid", lambda: grid_lines(
+            (WINDOW_WIDTH, WINDOW_HEIGHT), GRID_SIZE, GRID_WIDTH, GRID_HEIGHT, GRAY))
+        self.layers.add("shade", lambda: shade((WINDOW_WIDTH, WINDOW_HEIGHT), BLACK, 128))
         
-        # Create first piece
-        self.current_piece = Tetromino()
+        # The rules of the game (see tetris_core.py). Its board stores
+        # the piece COLORS, so we can draw them straight from the board.
+        # rng=random: pieces come from Python's random module
+        self.core = TetrisCore(GRID_WIDTH, GRID_HEIGHT, rng=random, engine=BOARD_ENGINE,
+                               wall_kicks=WALL_KICKS, palette=COLORS)
         
         # Timing for automatic falling
         self.last_fall_time = pygame.time.get_ticks()
-        
-        # Score and game state
-        self.score = 0
-        self.lines_cleared = 0
-        self.game_over = False
     
-    def check_collision(self, piece, offset_x=0, offset_y=0):
-        """
-        Check if a piece collides with the grid or walls
-        
-        COLLISION DETECTION:
-        We check every filled block in the piece's shape
-        against the game grid and boundaries
-        """
-        
-        for row_idx, row in enumerate(piece.shape):
-            for col_idx, cell in enumerate(row):
-                if cell:  # If this cell is filled
-                    
-                    # Calculate position in the grid
-                    x = piece.x + col_idx + offset_x
-                    y = piece.y + row_idx + offset_y
-                    
-                    # Check boundaries
-                    if x < 0 or x >= GRID_WIDTH or y >= GRID_HEIGHT:
-                        return True
-                    
-                    # Check if below the top (prevents collision on spawn)
-                    if y < 0:
-                        continue
-                    
-                    # Check collision with existing blocks
-                    if self.grid[y][x] != 0:
-                        return True
-        
-        return False
+    # The game's state, read from the core
     
-    def lock_piece(self):
-        """
-        Lock the current piece into the grid
-        
-        GRID MANIPULATION:
-        We copy the piece's shape into the main grid
-        """
-        
-        for row_idx, row in enumerate(self.current_piece.shape):
-            for col_idx, cell in enumerate(row):
-                if cell:
-                    x = self.current_piece.x + col_idx
-                    y = self.current_piece.y + row_idx
-                    
-                    # Check for game over (piece at top)
-                    if y < 0:
-                        self.game_over = True
-                        return
-                    
-                    # Place the color in the grid
-                    self.grid[y][x] = self.current_piece.color
-        
-        # Check for completed lines
-        self.clear_lines()
-        
-        # Create new piece
-        self.current_piece = Tetromino()
+    @property
+    def grid(self):
+        """2D ARRAY of the locked blocks: grid[row][col] is 0 (empty) or a color"""
+        return self.core.board.colors
     
-    def clear_lines(self):
-        """
-        Remove completed lines and shift everything down
-        
-        LINE CLEARING ALGORITHM:
-        1. Find all full rows
-        2. Remove them
-        3. Add empty rows at the top
-        """
-        
-        lines_to_clear = []
-        
-        # Find full rows
-        for row_idx, row in enumerate(self.grid):
-            # all() checks if ALL items in a list are True (non-zero)
-            if all(cell != 0 for cell in row):
-                lines_to_clear.append(row_idx)
-        
-        # Remove full rows and add empty rows at top
-        for row_idx in lines_to_clear:
-            del self.grid[row_idx]
-            self.grid.insert(0, [0 for _ in range(GRID_WIDTH)])
+    @property
+    def current_piece(self):
+        return self.core.piece
+    
+    @property
+    def score(self):
+        return self.core.score
+    
+    @property
+    def lines_cleared(self):
+        return self.core.lines_cleared
+    
+    @property
+    def game_over(self):
+        return self.core.game_over
+    
+    def restart(self):
+        """Start a new game (the window and everything else stays)"""
         
-        # Update score
-        if lines_to_clear:
-            self.lines_cleared += len(lines_to_clear)
-            # More lines at once = more points!
-            self.score += (len(lines_to_clear) ** 2) * 100
+        self.core.reset()
+        self.last_fall_time = pygame.time.get_ticks()
     
     def handle_input(self):
         """Handle keyboard input"""
         
         for event in pygame.event.get():
+            self.profiler.handle_event(event)
+            
             if event.type == pygame.QUIT:
                 pygame.quit()
                 sys.exit()
             
             if self.game_over:
                 if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-                    self.__init__()  # Restart
+                    self.restart()
                 continue
             
-            if event.type == pygame.KEYDOWN:
-                # Move left
-                if event.key == pygame.K_LEFT:
-                    if not self.check_collision(self.current_piece, offset_x=-1):
-                        self.current_piece.x -= 1
-                
-                # Move right
-                elif event.key == pygame.K_RIGHT:
-                    if not self.check_collision(self.current_piece, offset_x=1):
-                        self.current_piece.x += 1
-                
-                # Move down faster
-                elif event.key == pygame.K_DOWN:
-                    if not self.check_collision(self.current_piece, offset_y=1):
-                        self.current_piece.y += 1
-                        self.score += 1  # Bonus points for manual drop
-                
-                # Rotate
-                elif event.key == pygame.K_UP:
-                    rotated_shape = self.current_piece.rotate()
-                    old_shape = self.current_piece.shape
-                    self.current_piece.shape = rotated_shape
-                    
-                    # Check if rotation is valid
-                    if self.check_collision(self.current_piece):
-                        self.current_piece.shape = old_shape  # Undo rotation
+            if event.type == pygame.KEYDOWN and event.key in self.KEY_ACTIONS:
+                self.core.act(self.KEY_ACTIONS[event.key])
     
     def update(self):
         """Update game state"""
@@ -296,17 +176,11 @@ class TetrisGame:
         if self.game_over:
             return
         
-        # Automatic falling
+        # Automatic falling: one gravity "tick" every FALL_SPEED milliseconds
+        # (the piece moves down, or locks in place if it can't)
         current_time = pygame.time.get_ticks()
         if current_time - self.last_fall_time > FALL_SPEED:
-            
-            # Try to move piece down
-            if not self.check_collision(self.current_piece, offset_y=1):
-                self.current_piece.y += 1
-            else:
-                # Can't move down - lock it in place
-                self.lock_piece()
-            
+            self.core.tick()
             self.last_fall_time = current_time
     
     def draw(self):
@@ -337,49 +211,47 @@ class TetrisGame:
                         pygame.draw.rect(self.screen, BLACK,
                                        [x, y, GRID_SIZE, GRID_SIZE], 2)
         
-        # Draw grid lines
-        for i in range(GRID_WIDTH + 1):
-            pygame.draw.line(self.screen, GRAY, (i * GRID_SIZE, 0),
-                           (i * GRID_SIZE, WINDOW_HEIGHT), 1)
-        for i in range(GRID_HEIGHT + 1):
-            pygame.draw.line(self.screen, GRAY, (0, i * GRID_SIZE),
-                           (WINDOW_WIDTH, i * GRID_SIZE), 1)
+        # Draw grid lines (one prebaked picture instead of 32 lines)
+        self.layers.blit(self.screen, "grid")
         
         # Draw score
-        font = pygame.font.Font(None, 36)
-        score_text = font.render(f'Score: {self.score}', True, WHITE)
+        # (render_text reuses fonts and text images it already made)
+        score_text = render_text(f'Score: {self.score}', 36, WHITE)
         self.screen.blit(score_text, (10, 10))
         
-        lines_text = font.render(f'Lines: {self.lines_cleared}', True, WHITE)
+        lines_text = render_text(f'Lines: {self.lines_cleared}', 36, WHITE)
         self.screen.blit(lines_text, (10, 50))
         
         # Draw game over
         if self.game_over:
-            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-            overlay.set_alpha(128)
-            overlay.fill(BLACK)
-            self.screen.blit(overlay, (0, 0))
+            self.layers.blit(self.screen, "shade")  # Dim the board
             
-            big_font = pygame.font.Font(None, 48)
-            game_over_text = big_font.render('GAME OVER', True, WHITE)
+            game_over_text = render_text('GAME OVER', 48, WHITE)
             text_rect = game_over_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2))
             self.screen.blit(game_over_text, text_rect)
             
-            small_font = pygame.font.Font(None, 24)
-            restart_text = small_font.render('Press SPACE to restart', True, WHITE)
+            restart_text = render_text('Press SPACE to restart', 24, WHITE)
             restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 + 50))
             self.screen.blit(restart_text, restart_rect)
         
+        self.profiler.draw_overlay(self.screen)
         pygame.display.flip()
     
+    def step(self):
+        """One frame: input, update, draw"""
+        
+        with self.profiler.frame():
+            with self.profiler.phase("input"):
+                self.handle_input()
+            with self.profiler.phase("update"):
+                self.update()
+            with self.profiler.phase("draw"):
+                self.draw()
+    
     def run(self):
-        """Main game loop"""
+        """Main game loop (doesn't freeze the page when run in a browser)"""
         
-        while True:
-            self.handle_input()
-            self.update()
-            self.draw()
-            self.clock.tick(FPS)
+        run_game(self.step, FPS, self.clock, on_exit=pygame.quit)
 
 
 # ============================================================================
@@ -399,12 +271,14 @@ if __name__ == "__main__":
 # ✅ 2D arrays (grids)
 # ✅ List comprehensions (quick list creation)
 # ✅ Nested loops (loops inside loops)
+# ✅ Bitmasks (a whole row in one number - see tetris_board.py)
 #
 # ALGORITHMS:
 # ✅ Collision detection
-# ✅ Matrix rotation
+# ✅ Matrix rotation (and lookup tables)
 # ✅ Line clearing
 # ✅ Gravity simulation
+# ✅ Separating the rules from the drawing (tetris_core.py)
 #
 # CHALLENGES:
 # 🎯 Add a "next piece" preview
@@ -0,0 +1,186 @@
+"""
+🧱 The Tetris board - two ways to store it!
+
+Both boards do the same three jobs:
+- collides(shape, x, y)  would a piece at (x, y) hit a wall, the floor or a block?
+- place(shape, x, y, color)  lock a piece into the board
+- clear_full_rows()  remove full rows, return how many were removed
+- occupancy()  every row as a bitmask (bit c = column c filled), top first
+
+and both keep `colors`: a list of rows, each a list with 0 (empty) or
+the color of the block in that cell. That's what gets drawn.
+
+ListBoard is the simple version: look at every cell, one by one.
+
+BitBoard stores each row as a single whole number too - a BITMASK, where
+bit number c is 1 if column c is filled:
+
+    row  [■ □ □ ■ ■ □ □ □ □ □]   ->   0b0000011001   (bits read right to left)
+
+A piece is a few of those masks, so "does it hit anything?" becomes one
+AND (&) per piece row, and "is the row full?" is one comparison.
+The walls are extra always-filled bits on both sides of every row, so
+bumping into a wall is found by the very same AND!
+"""
+
+# Extra wall columns on each side of a BitBoard row (a piece is never
+# more than 4 cells wide, so 4 is always enough)
+WALL = 4
+
+# The board types you can pick from (see make_board)
+BOARD_ENGINES = {}
+
+
+def shape_key(shape):
+    """A shape as nested tuples (usable as a dictionary key)"""
+    return shape if isinstance(shape, tuple) else tuple(tuple(row) for row in shape)
+
+
+def shape_cells(shape):
+    """(dx, dy) of every block in a shape (precomputed for tetris_pieces shapes)"""
+    cells = getattr(shape, "cells", None)
+    if cells is None:
+        cells = [(col_idx, row_idx)
+                 for row_idx, row in enumerate(shape)
+                 for col_idx, cell in enumerate(row) if cell]
+    return cells
+
+
+class ListBoard:
+    """A board that checks cells one at a time"""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.colors = [[0] * width for _ in range(height)]
+
+    def collides(self, shape, x, y):
+        for col_idx, row_idx in shape_cells(shape):
+            cell_x = x + col_idx
+            cell_y = y + row_idx
+            if cell_x < 0 or cell_x >= self.width or cell_y >= self.height:
+                return True
+            # Above the top of the board is open space
+            if cell_y >= 0 and self.colors[cell_y][cell_x] != 0:
+                return True
+        return False
+
+    def place(self, shape, x, y, color):
+        """Lock a piece in. Returns False (placing nothing) if it sticks out the top."""
+        cells = [(x + col_idx, y + row_idx) for col_idx, row_idx in shape_cells(shape)]
+        if any(cell_y < 0 for _, cell_y in cells):
+            return False
+        for cell_x, cell_y in cells:
+            self.colors[cell_y][cell_x] = color
+        return True
+
+    def clear_full_rows(self):
+        kept = [row for row in self.colors if not all(cell != 0 for cell in row)]
+        cleared = self.height - len(kept)
+        if cleared:
+            self.colors = [[0] * self.width for _ in range(cleared)] + kept
+        return cleared
+
+    def occupancy(self):
+        return tuple(sum(1 << col for col, cell in enumerate(row) if cell != 0) for row in self.colors)
+
+
+class BitBoard:
+    """A board that stores every row as a bitmask (fast!)"""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+
+        # An empty row is just the two walls; a full row has every bit set
+        self.full_row = (1 << (width + 2 * WALL)) - 1
+        self.empty_row = self.full_row ^ (((1 << width) - 1) << WALL)
+
+        self.rows = [self.empty_row] * height
+        self.colors = [[0] * width for _ in range(height)]
+        self._masks = {}  # shape -> its row masks (worked out once per shape)
+
+    def piece_masks(self, shape):
+        """
+        One mask per piece row, lined up for x = 0.
+        Rows with no blocks are left out: (row offset, mask) pairs.
+        Shapes from tetris_pieces come with their masks already made.
+        """
+        masks = getattr(shape, "masks", None)
+        if masks is not None:
+            return masks
+        key = shape_key(shape)
+        masks = self._masks.get(key)
+        if masks is None:
+            masks = []
+            for row_idx, row in enumerate(key):
+                mask = 0
+                for col_idx, cell in enumerate(row):
+                    if cell:
+                        mask |= 1 << (col_idx + WALL)
+                if mask:
+                    masks.append((row_idx, mask))
+            masks = self._masks[key] = tuple(masks)
+        return masks
+
+    def collides(self, shape, x, y):
+        if x < -WALL or x > self.width:
+            return True  # Way past a wall
+        rows = self.rows
+        height = self.height
+        for row_idx, mask in self.piece_masks(shape):
+            cell_y = y + row_idx
+            if cell_y >= height:
+                return True  # Below the floor
+            row = rows[cell_y] if cell_y >= 0 else self.empty_row
+            if row & (mask << x if x >= 0 else mask >> -x):
+                return True
+        return False
+
+    def place(self, shape, x, y, color):
+        """Lock a piece in. Returns False (placing nothing) if it sticks out the top."""
+        masks = self.piece_masks(shape)
+        if y + masks[0][0] < 0:
+            return False
+        for row_idx, mask in masks:
+            cell_y = y + row_idx
+            mask = mask << x if x >= 0 else mask >> -x
+            self.rows[cell_y] |= mask
+            color_row = self.colors[cell_y]
+            bits = mask >> WALL
+            col = 0
+            while bits:
+                if bits & 1:
+                    color_row[col] = color
+                bits >>= 1
+                col += 1
+        return True
+
+    def clear_full_rows(self):
+        full = self.full_row
+        if full not in self.rows:
+            return 0  # The usual case: nothing to clear
+
+        # Keep the rows that aren't full - one pass, no shuffling row by row
+        kept = [i for i, row in enumerate(self.rows) if row != full]
+        cleared = self.height - len(kept)
+        self.rows = [self.empty_row] * cleared + [self.rows[i] for i in kept]
+        self.colors = [[0] * self.width for _ in range(cleared)] + [self.colors[i] for i in kept]
+        return cleared
+
+    def occupancy(self):
+        inside = (1 << self.width) - 1
+        return tuple((row >> WALL) & inside for row in self.rows)
+
+
+BOARD_ENGINES["list"] = ListBoard
+BOARD_ENGINES["bits"] = BitBoard
+
+
+def make_board(width, height, engine="bits"):
+    """A new empty board ("bits" or "list")"""
+    try:
+        board_class = BOARD_ENGINES[engine]
+    except KeyError:
+        raise ValueError(f"Unknown board engine {engine!r} (pick one of: {', '.join(BOARD_ENGINES)})")
+    return board_class(width, height)
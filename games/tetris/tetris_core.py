@@ -0,0 +1,310 @@
+"""
+🧠 Tetris without a window - just the rules!
+
+TetrisCore knows nothing about pygame, the screen or the clock. It only
+changes when you tell it to:
+
+    core = TetrisCore(seed=42)       # same seed = same pieces, every time
+    core.act(LEFT)                   # the player pressed a key
+    core.tick()                      # gravity: one step down (or lock)
+
+That makes it useful for much more than playing:
+- the pygame game in main.py draws it and feeds it key presses
+- bots can play millions of games quickly, with no window at all
+- a game can be replayed exactly from its seed and list of actions
+
+For bots there are two ways to play:
+- step(action)            one action, then one gravity tick
+- drop_at(rotation, x)    pick where the piece lands; it drops straight down
+
+and observe() returns what the game looks like right now.
+"""
+import random
+from typing import NamedTuple
+
+from tetris_board import make_board
+from tetris_pieces import KICKS, NO_KICKS, ROTATIONS, SHAPES
+
+# Actions (what a player or bot can do)
+NOOP, LEFT, RIGHT, DOWN, ROTATE, DROP = range(6)
+ACTION_NAMES = ("noop", "left", "right", "down", "rotate", "drop")
+
+# Points for clearing n lines at once: n * n * LINE_POINTS
+LINE_POINTS = 100
+
+
+class Tetromino:
+    """
+    A falling piece: which shape (kind), how far it's turned (rotation)
+    and where its top-left corner is (x, y).
+    """
+
+    __slots__ = ("kind", "rotation", "x", "y", "color")
+
+    def __init__(self, kind, x, y, color):
+        self.kind = kind
+        self.rotation = 0
+        self.x = x
+        self.y = y
+        self.color = color
+
+    @property
+    def shape(self):
+        """The piece's blocks in its current rotation (a 2D array of 0s and 1s)"""
+        return ROTATIONS[self.kind][self.rotation]
+
+    def rotate(self):
+        """
+        Which rotation the piece would have after turning 90 degrees clockwise.
+
+        All four rotations were worked out in advance (see tetris_pieces.py),
+        so turning is just counting 0, 1, 2, 3, 0, 1, ...
+        """
+        return (self.rotation + 1) % 4
+
+
+class Observation(NamedTuple):
+    """A snapshot of the game for bots (nothing in it can be changed)"""
+    rows: tuple        # one bitmask per board row, top first (bit c = column c filled)
+    kind: int          # the falling piece's shape (0-6)
+    rotation: int      # ...its rotation (0-3)
+    x: int             # ...and position
+    y: int
+    score: int
+    lines_cleared: int
+    game_over: bool
+
+
+class TetrisCore:
+    """The rules of Tetris, driven by actions and ticks"""
+
+    def __init__(self, width=10, height=20, seed=None, rng=None, engine="bits",
+                 wall_kicks=False, palette=None):
+        """
+        seed        makes the pieces repeatable (ignored if rng is given)
+        rng         anything with randint(), e.g. the random module itself
+        engine      how the board is stored: "bits" or "list"
+        wall_kicks  nudge pieces that can't turn where they are
+        palette     what goes into the board for each kind of piece
+                    (a color for drawing; 1-7 by default)
+        """
+        self.width = width
+        self.height = height
+        self.engine = engine
+        self.kicks = KICKS if wall_kicks else (NO_KICKS,) * len(SHAPES)
+        self.palette = tuple(palette) if palette is not None else tuple(range(1, len(SHAPES) + 1))
+        self.rng = rng if rng is not None else random.Random(seed)
+        self.reset()
+
+    def reset(self, seed=None):
+        """Start a new game (reseeding the pieces if a seed is given)"""
+        if seed is not None:
+            self.rng.seed(seed)
+        self.board = make_board(self.width, self.height, self.engine)
+        self.score = 0
+        self.lines_cleared = 0
+        self.pieces = 0    # Pieces locked so far
+        self.ticks = 0     # Gravity ticks so far
+        self.game_over = False
+        self.piece = None
+        self.spawn()
+
+    # ------------------------------------------------------------------
+    # Pieces
+    # ------------------------------------------------------------------
+
+    def spawn(self):
+        """
+        Bring in a random new piece at the top-middle of the board.
+        If it already overlaps blocks there, the stack reached the top:
+        GAME OVER!
+        """
+        kind = self.rng.randint(0, len(SHAPES) - 1)
+        x = self.width // 2 - ROTATIONS[kind][0].width // 2
+        self.piece = Tetromino(kind, x, 0, self.palette[kind])
+        if self.board.collides(self.piece.shape, x, 0):
+            self.game_over = True
+
+    def fits(self, rotation, x, y):
+        """Would the current piece fit at this rotation and position?"""
+        return not self.board.collides(ROTATIONS[self.piece.kind][rotation], x, y)
+
+    def move(self, dx, dy):
+        """Slide the piece if there's room. Returns True if it moved."""
+        piece = self.piece
+        if self.game_over or self.board.collides(piece.shape, piece.x + dx, piece.y + dy):
+            return False
+        piece.x += dx
+        piece.y += dy
+        return True
+
+    def rotate(self):
+        """
+        Turn the piece if it fits (maybe nudged by a wall kick).
+        Returns True if it turned.
+        """
+        if self.game_over:
+            return False
+        piece = self.piece
+        rotation = piece.rotate()
+        rotated_shape = ROTATIONS[piece.kind][rotation]
+
+        # Check if rotation is valid (trying each kick in order)
+        for dx, dy in self.kicks[piece.kind]:
+            if not self.board.collides(rotated_shape, piece.x + dx, piece.y + dy):
+                piece.rotation = rotation
+                piece.x += dx
+                piece.y += dy
+                return True
+        return False
+
+    def soft_drop(self):
+        """Move down one row (1 bonus point). Returns True if it moved."""
+        if self.move(0, 1):
+            self.score += 1
+            return True
+        return False
+
+    def hard_drop(self):
+        """Drop the piece straight to the bottom and lock it. Returns lines cleared."""
+        if self.game_over:
+            return 0
+        piece = self.piece
+        while not self.board.collides(piece.shape, piece.x, piece.y + 1):
+            piece.y += 1
+        return self.lock_piece()
+
+    def lock_piece(self):
+        """
+        Lock the current piece into the board, clear lines and spawn
+        the next piece. Returns how many lines were cleared.
+        """
+        piece = self.piece
+
+        # Copy the piece into the board (fails if it sticks out the top)
+        if not self.board.place(piece.shape, piece.x, piece.y, piece.color):
+            self.game_over = True
+            return 0
+        self.pieces += 1
+
+        cleared = self.board.clear_full_rows()
+        if cleared:
+            self.lines_cleared += cleared
+            # More lines at once = more points!
+            self.score += (cleared ** 2) * LINE_POINTS
+
+        self.spawn()
+        return cleared
+
+    # ------------------------------------------------------------------
+    # Driving the game
+    # ------------------------------------------------------------------
+
+    def tick(self):
+        """
+        Gravity: move the piece down one row, or lock it if it can't.
+        Returns how many lines were cleared (0 most of the time).
+        """
+        if self.game_over:
+            return 0
+        self.ticks += 1
+        if self.move(0, 1):
+            return 0
+        return self.lock_piece()
+
+    def act(self, action):
+        """Do one action (LEFT, RIGHT, DOWN, ROTATE, DROP or NOOP). Returns True if it did something."""
+        if action == LEFT:
+            return self.move(-1, 0)
+        if action == RIGHT:
+            return self.move(1, 0)
+        if action == DOWN:
+            return self.soft_drop()
+        if action == ROTATE:
+            return self.rotate()
+        if action == DROP:
+            pieces = self.pieces
+            self.hard_drop()
+            return self.pieces != pieces
+        return False
+
+    def step(self, action=NOOP):
+        """One action, then one gravity tick. Returns lines cleared during the step."""
+        lines = self.lines_cleared
+        self.act(action)
+        self.tick()
+        return self.lines_cleared - lines
+
+    def placements(self):
+        """Every (rotation, x) the current piece can be dropped from (at the top)"""
+        if self.game_over:
+            return []
+        piece = self.piece
+        result = []
+        seen = set()
+        for rotation, shape in enumerate(ROTATIONS[piece.kind]):
+            if shape.rows in seen:
+                continue  # Same shape as an earlier rotation (like the O piece)
+            seen.add(shape.rows)
+            # Shapes have no empty columns, so x never goes below 0
+            for x in range(self.width - shape.width + 1):
+                if not self.board.collides(shape, x, piece.y):
+                    result.append((rotation, x))
+        return result
+
+    def drop_at(self, rotation, x):
+        """
+        Put the current piece in this rotation at column x, then drop it.
+        Returns lines cleared, or None if it doesn't fit there.
+        """
+        if self.game_over or not self.fits(rotation, x, self.piece.y):
+            return None
+        self.piece.rotation = rotation
+        self.piece.x = x
+        return self.hard_drop()
+
+    def observe(self):
+        """What the game looks like right now (see Observation)"""
+        piece = self.piece
+        return Observation(self.board.occupancy(), piece.kind, piece.rotation, piece.x, piece.y,
+                           self.score, self.lines_cleared, self.game_over)
+
+
+
+# ============================================================================
+# HEADLESS EPISODES (used by batch_runner.py)
+# ============================================================================
+
+def random_policy(core, rng):
+    """Press a random key every tick (a very bad player!)"""
+    core.step(rng.randrange(len(ACTION_NAMES)))
+
+
+def drop_policy(core, rng):
+    """Drop each piece at a random spot it fits"""
+    core.drop_at(*rng.choice(core.placements()))
+
+
+POLICIES = {"random": random_policy, "drop": drop_policy}
+
+
+def run_episode(seed, policy="random", max_frames=100_000):
+    """
+    Play one whole game without a window. Returns its results:
+    score, lines_cleared, frames (policy moves) and whether the game
+    actually ended (False if it ran out of frames).
+    """
+    core = TetrisCore(seed=seed)
+    play = POLICIES[policy]
+    rng = random.Random(seed ^ 0x5EED)  # The policy's own dice
+    frames = 0
+    while not core.game_over and frames < max_frames:
+        play(core, rng)
+        frames += 1
+    return {
+        "score": core.score,
+        "lines_cleared": core.lines_cleared,
+        "length": None,
+        "frames": frames,
+        "finished": core.game_over,
+    }
@@ -0,0 +1,127 @@
+"""
+🔄 The seven Tetris pieces, in all four rotations - worked out ONCE.
+
+Turning a shape means building a brand new list of lists. Instead of
+doing that every time UP is pressed, we rotate every shape four times
+when the game starts and keep the results in a table:
+
+    ROTATIONS[kind][rotation]    kind = 0..6 (I, O, T, S, Z, J, L)
+                                 rotation = 0..3 (quarter turns clockwise)
+
+Rotating a piece is now just  rotation = (rotation + 1) % 4  - no new
+lists at all! Everything in the table is a tuple, so it can't be changed
+by accident.
+
+WALL KICKS:
+If a turned piece would poke into a wall or a block, real Tetris tries
+shifting it a little ("kicking" it) before giving up. KICKS lists the
+(dx, dy) shifts to try, in order.
+"""
+from tetris_board import WALL
+
+# Tetromino shapes
+# These are 2D ARRAYS (lists of lists)!
+# 1 = filled block, 0 = empty space
+SHAPES = [
+    # I piece
+    [[1, 1, 1, 1]],
+
+    # O piece
+    [[1, 1],
+     [1, 1]],
+
+    # T piece
+    [[0, 1, 0],
+     [1, 1, 1]],
+
+    # S piece
+    [[0, 1, 1],
+     [1, 1, 0]],
+
+    # Z piece
+    [[1, 1, 0],
+     [0, 1, 1]],
+
+    # J piece
+    [[1, 0, 0],
+     [1, 1, 1]],
+
+    # L piece
+    [[0, 0, 1],
+     [1, 1, 1]],
+]
+
+I_PIECE = 0
+
+# Shifts to try when a turned piece doesn't fit: stay put, one left,
+# one right, one up. The long I piece may need two steps sideways.
+NO_KICKS = ((0, 0),)
+BASIC_KICKS = ((0, 0), (-1, 0), (1, 0), (0, -1))
+I_KICKS = ((0, 0), (-1, 0), (1, 0), (-2, 0), (2, 0), (0, -1))
+
+
+def rotate_clockwise(shape):
+    """
+    Rotate a shape 90 degrees clockwise!
+
+    ROTATION ALGORITHM:
+    To rotate a 2D array, we:
+    1. Transpose it (swap rows and columns)
+    2. Reverse each row
+
+    Example: [[1, 0],    becomes    [[0, 1],
+              [1, 1]]                 [1, 1]]
+    """
+    return tuple(row[::-1] for row in zip(*shape))
+
+
+class Orientation:
+    """
+    One shape in one rotation, with everything about it worked out:
+
+    rows    the shape as a tuple of tuples (1 = block)
+    cells   (dx, dy) of every block, from the shape's top-left corner
+    masks   (dy, bitmask) for every row with blocks (for the BitBoard)
+
+    Looping over an Orientation gives its rows, just like a plain shape.
+    """
+
+    __slots__ = ("rows", "cells", "masks", "width", "height")
+
+    def __init__(self, rows):
+        self.rows = tuple(tuple(row) for row in rows)
+        self.height = len(self.rows)
+        self.width = len(self.rows[0])
+        self.cells = tuple((col_idx, row_idx)
+                           for row_idx, row in enumerate(self.rows)
+                           for col_idx, cell in enumerate(row) if cell)
+        self.masks = tuple((row_idx, sum(1 << (col_idx + WALL) for col_idx, cell in enumerate(row) if cell))
+                           for row_idx, row in enumerate(self.rows) if any(row))
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __getitem__(self, index):
+        return self.rows[index]
+
+    def __len__(self):
+        return self.height
+
+    def __repr__(self):
+        return f"Orientation({self.rows})"
+
+
+def _all_rotations(shape):
+    rotations = []
+    rows = tuple(tuple(row) for row in shape)
+    for _ in range(4):
+        rotations.append(Orientation(rows))
+        rows = rotate_clockwise(rows)
+    return tuple(rotations)
+
+
+# ROTATIONS[kind][rotation] -> Orientation
+ROTATIONS = tuple(_all_rotations(shape) for shape in SHAPES)
+
+# KICKS[kind] -> shifts to try when turning that piece
+KICKS = tuple(I_KICKS if kind == I_PIECE else BASIC_KICKS for kind in range(len(SHAPES)))
@@ -1,82 +1,165 @@
 """
 Pygame loader for Streamlit with Pyodide
 This module handles loading Pygame in the browser environment.
+
+Pyodide (and the pygame package) is several megabytes, so it is only
+fetched and booted ONCE per browser tab:
+- On the Python side, a session_state flag remembers that the loader
+  script was already sent to this tab.
+- On the browser side, the script reuses an existing window.pyodide
+  (or the boot that is still in progress) instead of starting another.
+- If booting fails (say the CDN is unreachable), the next rerun tries
+  again: the boot script leaves a window.startPyodide() function behind,
+  and a tiny snippet sent on every rerun calls it when nothing is booting.
+
+Pyodide comes from the app's own vendored copy when there is one
+(see pyodide_bundle.py), otherwise from the jsDelivr CDN.
 """
 import streamlit as st
 
-def load_pygame():
-    """
-    Load Pygame using Pyodide in the browser.
-    Returns True if successful, False otherwise.
-    """
-    try:
-        # Add Pyodide initialization if not already loaded
-        st.markdown("""
-        <script src="https://cdn.jsdelivr.net/pyodide/v0.23.4/full/pyodide.js"></script>
-        <script>
-            window.pyodideReady = false;
-            window.pygameLoaded = false;
-            
+from pyodide_bundle import pyodide_index_url
+
+# session_state key that marks "the loader was already sent to this tab"
+SESSION_FLAG = "pygame_loader_injected"
+
+
+def _loader_script(index_url):
+    """The one-time boot script. Safe to run again - it reuses what exists."""
+    return """
+    <script>
+        (function() {
+            // Already booted (or booting) in this tab? Reuse it!
+            if (window.pyodideInitPromise) {
+                return;
+            }
+
+            window.pyodideReady = Boolean(window.pyodide);
+            window.pygameLoaded = Boolean(window.pygameLoaded);
+
+            function loadScript(src) {
+                return new Promise(function(resolve, reject) {
+                    if (typeof loadPyodide !== 'undefined') {
+                        resolve();
+                        return;
+                    }
+                    const script = document.createElement('script');
+                    script.src = src;
+                    script.onload = resolve;
+                    script.onerror = function() { reject(new Error('Could not load ' + src)); };
+                    document.head.appendChild(script);
+                });
+            }
+
             async function initializePyodide() {
                 try {
-                    console.log("Initializing Pyodide...");
-                    let pyodide = await loadPyodide({
-                        indexURL: "https://cdn.jsdelivr.net/pyodide/v0.23.4/full/"
-                    });
-                    window.pyodide = pyodide;
-                    window.pyodideReady = true;
-                    console.log("Pyodide loaded successfully!");
-                    
-                    // Load Pygame package
-                    console.log("Loading Pygame package...");
-                    await pyodide.loadPackage(['pygame']);
-                    
-                    // Test basic Pygame import
-                    await pyodide.runPythonAsync(`
-                        import pygame
-                        import sys
-                        print("Pygame imported successfully!")
-                        print(f"Pygame version: {pygame.version.ver}")
-                    `);
-                    
-                    window.pygameLoaded = true;
-                    console.log("Pygame loaded and initialized successfully!");
-                    
-                    // Dispatch event to notify that Pygame is ready
-                    window.dispatchEvent(new Event('pygameReady'));
-                    
+                    if (!window.pyodide) {
+                        console.log("Initializing Pyodide...");
+                        // Relative URLs (our own static folder) become absolute
+                        const indexURL = new URL("__INDEX_URL__", window.location.href).href;
+                        await loadScript(indexURL + "pyodide.js");
+                        window.pyodide = await loadPyodide({
+                            indexURL: indexURL
+                        });
+                        window.pyodideReady = true;
+                        console.log("Pyodide loaded successfully!");
+                    }
+
+                    if (!window.pygameLoaded) {
+                        // Load Pygame package
+                        console.log("Loading Pygame package...");
+                        await window.pyodide.loadPackage(['pygame']);
+
+                        // Test basic Pygame import
+                        await window.pyodide.runPythonAsync(`
+                            import pygame
+                            import sys
+                            print("Pygame imported successfully!")
+                            print(f"Pygame version: {pygame.version.ver}")
+                        `);
+
+                        window.pygameLoaded = true;
+                        console.log("Pygame loaded and initialized successfully!");
+                    }
+
                 } catch (error) {
                     console.error("Error initializing Pyodide/Pygame:", error);
                     window.pyodideReady = true;
                     window.pygameLoaded = false;
-                    window.dispatchEvent(new Event('pygameReady'));
+                    // Let the next rerun try again (see _RETRY_SCRIPT)
+                    window.pyodideInitPromise = null;
                 }
+
+                // Dispatch event to notify that Pygame is ready (or failed)
+                window.dispatchEvent(new Event('pygameReady'));
             }
-            
+
+            // Kept on window so a later rerun can retry after a failure
+            window.startPyodide = function() {
+                window.pyodideInitPromise = initializePyodide();
+                return window.pyodideInitPromise;
+            };
+
             // Start initialization
-            initializePyodide();
-        </script>
-        """, unsafe_allow_html=True)
-        
-        # Add a status indicator
+            window.startPyodide();
+        })();
+    </script>
+    """.replace("__INDEX_URL__", index_url)
+
+
+# Sent on every rerun (it's tiny): boot again if an earlier attempt failed
+_RETRY_SCRIPT = """
+<script>
+    if (!window.pyodideInitPromise && !window.pygameLoaded && window.startPyodide) {
+        window.startPyodide();
+    }
+</script>
+"""
+
+
+def load_pygame():
+    """
+    Load Pygame using Pyodide in the browser.
+    Returns True if successful, False otherwise.
+    """
+    try:
+        # Only send the (heavy) boot script the first time this tab runs
+        if not st.session_state.get(SESSION_FLAG):
+            st.markdown(_loader_script(pyodide_index_url()), unsafe_allow_html=True)
+            st.session_state[SESSION_FLAG] = True
+        else:
+            st.markdown(_RETRY_SCRIPT, unsafe_allow_html=True)
+
+        # Add a status indicator (cheap - it only reads the window flags)
         st.markdown("""
         <div id="pygame-status" style="padding: 10px; background: #f0f0f0; border-radius: 5px; margin: 10px 0;">
             <p>🎮 Initializing Pygame in browser...</p>
         </div>
-        
+
         <script>
-            // Update status when Pygame is ready
-            window.addEventListener('pygameReady', function() {
-                const status = document.getElementById('pygame-status');
+            (function() {
+                function showStatus() {
+                    const status = document.getElementById('pygame-status');
+                    if (!status) {
+                        return;
+                    }
+                    if (window.pygameLoaded) {
+                        status.innerHTML = '<p style="color: green;">✅ Pygame is ready! Games can now be played.</p>';
+                    } else {
+                        status.innerHTML = '<p style="color: red;">❌ Failed to load Pygame. Check console for details.</p>';
+                    }
+                }
+
                 if (window.pygameLoaded) {
-                    status.innerHTML = '<p style="color: green;">✅ Pygame is ready! Games can now be played.</p>';
+                    // Booted on an earlier rerun - show it straight away
+                    showStatus();
                 } else {
-                    status.innerHTML = '<p style="color: red;">❌ Failed to load Pygame. Check console for details.</p>';
+                    // Update status when Pygame is ready
+                    window.addEventListener('pygameReady', showStatus, { once: true });
                 }
-            });
+            })();
         </script>
         """, unsafe_allow_html=True)
-        
+
         return True
     except Exception as e:
         st.error(f"Error initializing Pygame: {str(e)}")
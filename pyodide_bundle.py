@@ -0,0 +1,238 @@
+"""
+Self-hosted Pyodide runtime for the arcade.
+
+By default the browser downloads Pyodide from the jsDelivr CDN. This
+module lets the app serve its own copy instead, so games start offline
+and repeat visits come straight from the browser cache.
+
+    python pyodide_bundle.py vendor     # download Pyodide + pygame into ./static/pyodide
+    python pyodide_bundle.py serve      # serve ./static with long-lived cache headers
+
+The vendored files live in a folder named after a hash of their contents
+(for example static/pyodide/v0.23.4-1a2b3c4d5e6f/). A new build gets a new
+folder name, so browsers can cache every file "forever" without ever
+running stale code.
+"""
+import argparse
+import hashlib
+import json
+import mimetypes
+import os
+import re
+import shutil
+import sys
+import tempfile
+import urllib.request
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+PYODIDE_VERSION = "v0.23.4"
+PYODIDE_CDN_URL = f"https://cdn.jsdelivr.net/pyodide/{PYODIDE_VERSION}/full/"
+
+# Everything the browser may download lives under this folder
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+PYODIDE_DIR = STATIC_DIR / "pyodide"
+MANIFEST_PATH = PYODIDE_DIR / "manifest.json"
+
+# Files Pyodide needs to boot (relative to indexURL)
+CORE_FILES = (
+    "pyodide.js",
+    "pyodide.asm.js",
+    "pyodide.asm.wasm",
+    "python_stdlib.zip",
+    "repodata.json",
+)
+
+# Packages the games import
+PACKAGES = ("pygame",)
+
+# Where the browser finds STATIC_DIR. Streamlit serves ./static at
+# app/static/ when server.enableStaticServing is on; point this at
+# "python pyodide_bundle.py serve" (or a CDN/proxy) for proper cache headers.
+STATIC_URL_ENV = "ARCADE_STATIC_URL"
+DEFAULT_STATIC_URL = "app/static/"
+
+# "auto" (use the vendored bundle if there is one), "local" or "cdn"
+PYODIDE_SOURCE_ENV = "PYODIDE_SOURCE"
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+
+# Files whose path holds a content hash, so they can never change:
+# pyodide/v0.23.4-1a2b3c4d5e6f/<file> and bundles/<game>-1a2b3c4d5e6f.zip
+HASHED_PATH_RE = re.compile(
+    r"^/(pyodide/[^/]+-[0-9a-f]{12}/[^?#]*[^/?#]|bundles/[^/?#]+-[0-9a-f]{12}\.zip)([?#].*)?$"
+)
+
+
+def content_hash(paths, root):
+    """Short sha256 over the names and contents of the given files."""
+    digest = hashlib.sha256()
+    for path in sorted(paths):
+        digest.update(str(Path(path).relative_to(root)).encode())
+        with open(path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                digest.update(chunk)
+    return digest.hexdigest()[:12]
+
+
+def static_url():
+    """Base URL of STATIC_DIR as seen by the browser (always ends in /)."""
+    url = os.environ.get(STATIC_URL_ENV, DEFAULT_STATIC_URL)
+    return url if url.endswith("/") else url + "/"
+
+
+def read_manifest():
+    try:
+        with open(MANIFEST_PATH, "r") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def pyodide_index_url():
+    """
+    The indexURL the browser should load Pyodide from: the vendored
+    bundle if there is one (and PYODIDE_SOURCE allows it), else the CDN.
+    """
+    source = os.environ.get(PYODIDE_SOURCE_ENV, "auto").lower()
+    if source == "cdn":
+        return PYODIDE_CDN_URL
+
+    manifest = read_manifest()
+    if manifest and manifest.get("version") == PYODIDE_VERSION:
+        return static_url() + "pyodide/" + manifest["path"] + "/"
+    if source == "local":
+        print(f"⚠️ {PYODIDE_SOURCE_ENV}=local but no vendored Pyodide found - "
+              f"run: python pyodide_bundle.py vendor")
+    return PYODIDE_CDN_URL
+
+
+# ----------------------------------------------------------------------
+# Vendoring (download once, at build time)
+# ----------------------------------------------------------------------
+
+def _download(url, dest, sha256=None):
+    print(f"⬇️  {url}")
+    with urllib.request.urlopen(url) as response, open(dest, "wb") as file:
+        shutil.copyfileobj(response, file)
+    if sha256:
+        with open(dest, "rb") as file:
+            actual = hashlib.sha256(file.read()).hexdigest()
+        if actual != sha256:
+            raise ValueError(f"Checksum mismatch for {url}")
+
+
+def _resolve_packages(repodata, names):
+    """Package names (plus all their dependencies) to download."""
+    packages = repodata["packages"]
+    by_import = {}
+    for name, info in packages.items():
+        for imported in info.get("imports", []):
+            by_import.setdefault(imported.lower(), name)
+
+    wanted = []
+    todo = [name.lower() for name in names]
+    while todo:
+        requested = todo.pop()
+        name = requested if requested in packages else by_import.get(requested)
+        if name is None:
+            raise KeyError(f"Package not found in Pyodide {PYODIDE_VERSION}: {requested}")
+        if name in wanted:
+            continue
+        wanted.append(name)
+        todo.extend(dep.lower() for dep in packages[name].get("depends", []))
+    return wanted
+
+
+def vendor(packages=PACKAGES, base_url=PYODIDE_CDN_URL):
+    """Download Pyodide and the given packages into a content-hashed folder."""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        for name in CORE_FILES:
+            _download(base_url + name, tmp / name)
+
+        with open(tmp / "repodata.json", "r") as file:
+            repodata = json.load(file)
+        for name in _resolve_packages(repodata, packages):
+            info = repodata["packages"][name]
+            _download(base_url + info["file_name"], tmp / info["file_name"], info.get("sha256"))
+
+        files = [path for path in tmp.iterdir() if path.is_file()]
+        folder = f"{PYODIDE_VERSION}-{content_hash(files, tmp)}"
+        target = PYODIDE_DIR / folder
+        if target.exists():
+            print(f"✅ Already vendored: {target}")
+        else:
+            PYODIDE_DIR.mkdir(parents=True, exist_ok=True)
+            shutil.copytree(tmp, target)
+
+    with open(MANIFEST_PATH, "w") as file:
+        json.dump({"version": PYODIDE_VERSION, "path": folder, "packages": list(packages)}, file, indent=2)
+    print(f"✅ Pyodide {PYODIDE_VERSION} vendored into {target}")
+    return target
+
+
+# ----------------------------------------------------------------------
+# Serving (with cache headers Streamlit can't set)
+# ----------------------------------------------------------------------
+
+class StaticHandler(SimpleHTTPRequestHandler):
+    """Serves STATIC_DIR; files in hashed folders get immutable cache headers."""
+
+    status = None
+
+    extensions_map = {
+        **SimpleHTTPRequestHandler.extensions_map,
+        ".wasm": "application/wasm",
+        ".js": "application/javascript",
+        ".mjs": "application/javascript",
+        ".json": "application/json",
+        ".zip": "application/zip",
+        ".whl": "application/zip",
+    }
+
+    def send_response(self, code, message=None):
+        self.status = code  # end_headers() needs to know if this is a success
+        super().send_response(code, message)
+
+    def end_headers(self):
+        # The app page lives on another port, so allow cross-origin fetches
+        self.send_header("Access-Control-Allow-Origin", "*")
+        if self.status in (200, 304) and HASHED_PATH_RE.match(self.path):
+            # A content-hashed file can never change: cache it "forever"
+            self.send_header("Cache-Control", IMMUTABLE_CACHE)
+        else:
+            # Manifests, directory listings, errors, redirects...: check every time
+            self.send_header("Cache-Control", "no-cache")
+        super().end_headers()
+
+
+def serve(port=8502, directory=STATIC_DIR):
+    mimetypes.add_type("application/wasm", ".wasm")
+    handler = partial(StaticHandler, directory=str(directory))
+    with ThreadingHTTPServer(("", port), handler) as server:
+        print(f"🚀 Serving {directory} on http://localhost:{port}/")
+        print(f"   Start the app with {STATIC_URL_ENV}=http://localhost:{port}/")
+        server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    vendor_cmd = commands.add_parser("vendor", help="download Pyodide + packages into ./static/pyodide")
+    vendor_cmd.add_argument("--package", action="append", dest="packages",
+                            help="extra Pyodide package to include (repeatable)")
+    serve_cmd = commands.add_parser("serve", help="serve ./static with long-lived cache headers")
+    serve_cmd.add_argument("--port", type=int, default=8502)
+    args = parser.parse_args(argv)
+
+    if args.command == "vendor":
+        vendor(PACKAGES + tuple(args.packages or ()))
+    elif args.command == "serve":
+        serve(args.port)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,33 @@
+"""Tests for the shared game loop (game_utils/frame_loop.py)."""
+import asyncio
+
+from game_utils.frame_loop import REPLACED, run_async
+
+
+def run_loop(stop_results, step_result=None):
+    """Run the loop with should_stop() answering stop_results in turn; returns (steps, exits)."""
+    answers = iter(stop_results)
+    calls = {"steps": 0, "exits": 0}
+
+    def step():
+        calls["steps"] += 1
+        return step_result
+
+    def on_exit():
+        calls["exits"] += 1
+
+    asyncio.run(run_async(step, 1000, lambda: next(answers), on_exit))
+    return calls["steps"], calls["exits"]
+
+
+def test_stop_button_runs_on_exit():
+    assert run_loop([False, False, True]) == (2, 1)
+
+
+def test_replaced_launch_skips_on_exit():
+    # A newer launch owns pygame now: the old loop must not call pygame.quit()
+    assert run_loop([False, False, REPLACED]) == (2, 0)
+
+
+def test_step_returning_false_runs_on_exit():
+    assert run_loop([False, False], step_result=False) == (1, 1)